@@ -0,0 +1,217 @@
+# headless JSON / Arrow API over the same cached shelf the dashboard reads
+#
+#   python api.py --port 8502
+#   curl 'localhost:8502/stats?month=March&genre=Fantasy'
+#   curl 'localhost:8502/books?year=2024&format=arrow' > books.arrow
+#   curl 'localhost:8502/caches'
+import argparse
+import asyncio
+import io
+import json
+import logging
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from caches import SharedCache, cache_stats, shared_cache
+from loader import load_filter_engine, partition_key
+from rollups import load_rollup_cube, summarize_rows
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+RESPONSE_CACHE_SIZE = 256
+MAX_REQUEST_LINE = 8192
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# finished response bodies, content type and bytes
+response_cache = shared_cache("responses", RESPONSE_CACHE_SIZE, maxbytes=64 * 2**20, sizeof=lambda response: len(response[1]))
+
+
+# query string -> the sidebar's filters, e.g. ?year=2024&month=March&genre=Fantasy&genre=Drama&pages=400
+def parse_filters(params: dict) -> dict:
+    try:
+        years = tuple(sorted(int(year) for year in params.get("year", [])))
+        pages = int(params["pages"][0]) if "pages" in params else None
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "year and pages must be integers")
+
+    return {
+        "years": years,
+        "month": params.get("month", [None])[0],
+        "genres": tuple(params.get("genre", [])),
+        "authors": tuple(params.get("author", [])),
+        "pages": pages,
+    }
+
+
+# same cascade as display_sidebar: month, then genres, then authors, then the page cap
+def filter_state(filters: dict):
+    engine = load_filter_engine(filters["years"])
+    state = engine.start(filters["month"]).narrow("Genre", list(filters["genres"])).narrow("Author", list(filters["authors"]))
+    return state
+
+
+def books_frame(filters: dict) -> pd.DataFrame:
+    return filter_state(filters).view(filters["pages"])
+
+
+# per-month counts, pages, rating and reading time of the filtered books
+def months_frame(filters: dict) -> pd.DataFrame:
+    df = filter_state(filters).view(filters["pages"])
+    months = df.assign(Duration=(df["End Date"] - df["Start Date"]).dt.days).groupby("Month", observed=True)
+    return pd.DataFrame({
+        "Books": months.size(),
+        "Pages": months["Pages"].sum().astype("int64"),
+        "Average Rating": months["Rating"].mean().astype(float).round(2),
+        "Average Duration": months["Duration"].mean().round(2),
+    }).reset_index().assign(Month=lambda frame: frame["Month"].astype(str))
+
+
+# the dashboard's tiles and chart aggregates, from the rollup cube unless the page cap cuts through cells
+def shelf_stats(filters: dict) -> dict:
+    state = filter_state(filters)
+    df = state.view(filters["pages"])
+    summary = summarize_rows(df) if state.capped(filters["pages"]) else load_rollup_cube(filters["years"]).summarize(state)
+    durations = (df["End Date"] - df["Start Date"]).dt.days
+
+    return {
+        "books": summary["Books"],
+        "average_rating": None if pd.isna(summary["Average Rating"]) else summary["Average Rating"],
+        "favorite_genre": str(summary["Genre Counts"].idxmax()) if len(summary["Genre Counts"]) else None,
+        "genres": {str(genre): int(count) for genre, count in summary["Genre Counts"].items()},
+        "languages": {str(language): int(count) for language, count in summary["Language Counts"].items()},
+        "rating_histogram": {str(bucket): int(count) for bucket, count in summary["Rating Histogram"].items()},
+        "durations": {
+            "mean": round(float(durations.mean()), 2) if len(durations) else None,
+            "median": float(durations.median()) if len(durations) else None,
+            "max": int(durations.max()) if len(durations) else None,
+        },
+        "months": months_frame(filters).to_dict(orient="records"),
+    }
+
+
+def encode_frame(df: pd.DataFrame, output: str) -> tuple:
+    if output == "arrow":
+        if pa is None:
+            raise ApiError(HTTPStatus.NOT_ACCEPTABLE, "Arrow output needs pyarrow installed")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as stream:
+            stream.write_table(table)
+        return ARROW_TYPE, sink.getvalue()
+    # JSON dates are plain calendar days, Arrow keeps the timestamps
+    dates = df.select_dtypes("datetime")
+    df = df.assign(**{column: dates[column].dt.strftime("%Y-%m-%d") for column in dates})
+    return JSON_TYPE, df.to_json(orient="records", force_ascii=False).encode()
+
+
+ENDPOINTS = {
+    "/books": lambda filters, output: encode_frame(books_frame(filters), output),
+    "/months": lambda filters, output: encode_frame(months_frame(filters), output),
+    "/stats": lambda filters, output: (JSON_TYPE, json.dumps(shelf_stats(filters), ensure_ascii=False).encode()),
+}
+
+
+class ShelfApi:
+    def __init__(self, cache: SharedCache = response_cache):
+        self.cache = cache
+        # requests already being computed, identical concurrent requests wait for the same result
+        self._pending = {}
+
+    async def respond(self, path: str, params: dict) -> tuple:
+        # hit rates and sizes of the shared caches, never cached themselves
+        if path == "/caches":
+            return JSON_TYPE, cache_stats().to_json(orient="records").encode()
+        if path not in ENDPOINTS:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{path}'")
+
+        output = params.get("format", ["json"])[0]
+        if output not in ("json", "arrow"):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "format must be json or arrow")
+
+        filters = parse_filters(params)
+        try:
+            # the partition versions are part of the key, so edits to the shelf miss the cache
+            key = (path, output, partition_key(filters["years"]), *sorted(filters.items()))
+        except KeyError as error:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No books for year {error.args[0]}")
+
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = self._pending[key] = loop.run_in_executor(None, ENDPOINTS[path], filters, output)
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        response = await pending
+        self.cache.put(key, response)
+        return response
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            if not request_line or len(request_line) > MAX_REQUEST_LINE:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "Malformed request")
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            if method != "GET":
+                raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "Only GET is supported")
+
+            url = urlsplit(target)
+            content_type, body = await self.respond(url.path, parse_qs(url.query))
+            status = HTTPStatus.OK
+        except ApiError as error:
+            status, content_type, body = error.status, JSON_TYPE, json.dumps({"error": str(error)}).encode()
+        except ValueError:
+            status, content_type, body = HTTPStatus.BAD_REQUEST, JSON_TYPE, json.dumps({"error": "Malformed request"}).encode()
+        except Exception:
+            logging.getLogger(__name__).exception("request failed")
+            status, content_type, body = HTTPStatus.INTERNAL_SERVER_ERROR, JSON_TYPE, json.dumps({"error": "Internal error"}).encode()
+
+        head = f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        writer.write(head.encode("latin-1") + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int):
+    api = ShelfApi()
+    server = await asyncio.start_server(api.handle, host, port)
+    print(f"serving the shelf API on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    # bare-mode cache calls warn about the missing Streamlit runtime
+    logging.disable(logging.WARNING)
+
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import io
+import os
+import random
+from collections import Counter
+from typing import Iterable
+
+from caches import shared_cache
+from charts import COLORS
+from disk_cache import DiskStore
+
+WORD_CLOUD_SEED = 2024
+
+# rendered PNGs by author multiset, shared by every session
+cloud_cache = shared_cache("word clouds", 16, maxbytes=32 * 2**20, sizeof=len, store=DiskStore("word clouds", bytes, bytes, (os.path.abspath(__file__),)))
+
+
+# author word cloud as PNG bytes, cached on the author multiset
+def author_cloud(authors: Iterable[str]) -> bytes:
+    author_counts = tuple(sorted(Counter(authors).items()))
+    return cloud_cache.get_or_build(author_counts, lambda: _render_author_cloud(author_counts))
+
+
+def _render_author_cloud(author_counts: tuple) -> bytes:
+    # wordcloud pulls in matplotlib, only the Entire Year view pays for it
+    from wordcloud import WordCloud
+
+    authors_text = ", ".join(author for author, count in author_counts for _ in range(count))
+
+    rng = random.Random(WORD_CLOUD_SEED)
+
+    def custom_color_func(word, font_size, position, orientation, random_state=None, **kwargs):
+        return rng.choice(COLORS)
+
+    wordcloud = WordCloud(width=750, height=700, background_color='white', color_func=custom_color_func,
+                          random_state=WORD_CLOUD_SEED).generate(authors_text)
+
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
@@ -0,0 +1,59 @@
+# compares the old per-record language/duration code with the columnar versions in charts.py
+#
+#   python benchmarks/bench_aggregations.py --sizes 10000 100000 1000000
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from charts import book_durations, language_counts
+from synthetic import synthetic_shelf
+
+
+# the implementations display_charts used before
+def legacy_language_counts(df):
+    df_dict = df.to_dict(orient="records")
+    languages = [book['Language'] for book in df_dict]
+    return {lang: languages.count(lang) for lang in set(languages)}
+
+
+def legacy_durations(df):
+    df_dict = df.to_dict(orient="records")
+    for book in df_dict:
+        book['Start Date'] = pd.to_datetime(book['Start Date'])
+        book["End Date"] = pd.to_datetime(book["End Date"])
+    for book in df_dict:
+        book["Duration"] = (book["End Date"] - book["Start Date"]).days
+    return pd.DataFrame(df_dict).sort_values(by="Duration", ascending=False)
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    func(df)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'books':>10} {'stage':>10} {'legacy s':>10} {'columnar s':>11} {'speedup':>8}")
+    for size in args.sizes:
+        raw = synthetic_shelf(size)
+        # dates are parsed once at load time in the app
+        parsed = raw.assign(**{column: pd.to_datetime(raw[column], format="%m-%d-%Y") for column in ("Start Date", "End Date")})
+
+        for stage, legacy, columnar in (("languages", legacy_language_counts, language_counts),
+                                        ("durations", legacy_durations, book_durations)):
+            before = timed(legacy, raw)
+            after = timed(columnar, parsed)
+            print(f"{size:>10} {stage:>10} {before:>10.3f} {after:>11.4f} {before / after:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
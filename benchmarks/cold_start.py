@@ -0,0 +1,74 @@
+# time to first paint of a fresh interpreter, once per view, and which heavy modules it loaded
+#
+#   python benchmarks/cold_start.py --runs 5
+#   python benchmarks/cold_start.py --root /tmp/older-checkout   # same probe against another revision
+#   python benchmarks/cold_start.py --no-disk-cache              # what the first visitor pays without warm.py
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+VIEWS = ["Entire Year", "March"]
+HEAVY_MODULES = ["plotly.express", "wordcloud", "matplotlib", "matplotlib.pyplot"]
+
+# runs in a fresh interpreter inside the checkout: import the app, then paint one view in bare mode
+PROBE = """
+import json, logging, sys, time
+start = time.perf_counter()
+logging.disable(logging.WARNING)
+sys.path.insert(0, ".")
+import app
+imported = time.perf_counter()
+view = sys.argv[1]
+catalog, engine, progress = app.load_catalog(), app.load_filter_engine(), app.load_progress()
+df = engine.start(None if view == "Entire Year" else view).view()
+app.display_charts(view, df, progress)
+if view != "Entire Year":
+    app.display_cards(df, catalog)
+painted = time.perf_counter()
+print(json.dumps({"import": imported - start, "paint": painted - imported, "modules": [name for name in %r if name in sys.modules]}))
+""" % HEAVY_MODULES
+
+
+def probe(root: str, view: str, disk_cache: bool = True) -> dict:
+    env = dict(os.environ, BOOKSHELF_DISK_CACHE="on" if disk_cache else "off")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", PROBE, view], cwd=root, env=env, capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["wall"] = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", default=ROOT, help="checkout to measure")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-disk-cache", action="store_true", help="paint without the persistent cache")
+    parser.add_argument("--report", help="optional JSON report path")
+    args = parser.parse_args()
+
+    results = []
+    for view in VIEWS:
+        runs = [probe(args.root, view, not args.no_disk_cache) for _ in range(args.runs)]
+        row = {
+            "view": view,
+            "wall": statistics.median(run["wall"] for run in runs),
+            "import": statistics.median(run["import"] for run in runs),
+            "paint": statistics.median(run["paint"] for run in runs),
+            "modules": runs[-1]["modules"],
+        }
+        results.append(row)
+        print(f"{view:>12}  wall {row['wall']:.3f}s  import app {row['import']:.3f}s  paint {row['paint']:.3f}s  loaded {', '.join(row['modules']) or '-'}")
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump({"root": os.path.abspath(args.root), "runs": args.runs, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# many sessions painting the same view at once: figures, word cloud and covers from cold shared caches
+#
+#   python benchmarks/concurrent_viewers.py --viewers 1 50 200
+import argparse
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+# time the builds themselves, not reads from a warm disk cache
+os.environ.setdefault("BOOKSHELF_DISK_CACHE", "off")
+
+from author_cloud import author_cloud, cloud_cache
+from caches import cache_stats
+from charts import build_figures, figure_cache
+from covers import cover_thumbnail, thumbnail_cache
+from loader import load_catalog, load_filter_engine, load_progress
+
+
+# one session's share of a rerun for a view, without the Streamlit elements
+def paint(view: str, catalog, engine, progress):
+    df = engine.start(None if view == "Entire Year" else view).view()
+    build_figures(view, df, progress)
+    if view == "Entire Year":
+        author_cloud(df["Author"])
+    else:
+        for book_id in df.index:
+            book = catalog.by_id(book_id)
+            cover_thumbnail(book["Cover"], book["Cover Width"])
+
+
+# seconds until every viewer has painted, all released at the same moment
+def run(viewers: int, view: str, catalog, engine, progress) -> float:
+    for cache in (figure_cache, cloud_cache, thumbnail_cache):
+        cache.clear()
+
+    barrier = threading.Barrier(viewers + 1)
+
+    def viewer():
+        barrier.wait()
+        paint(view, catalog, engine, progress)
+
+    threads = [threading.Thread(target=viewer) for _ in range(viewers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--viewers", type=int, nargs="+", default=[1, 50, 200])
+    parser.add_argument("--views", nargs="+", default=["Entire Year", "March"])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    catalog, engine, progress = load_catalog(), load_filter_engine(), load_progress()
+
+    for view in args.views:
+        for viewers in args.viewers:
+            seconds = statistics.median(run(viewers, view, catalog, engine, progress) for _ in range(args.repeats))
+            print(f"{view:>12}  {viewers:>4} viewers  {seconds:.3f}s")
+
+    print(cache_stats().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
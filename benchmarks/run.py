@@ -0,0 +1,267 @@
+# times each data path of the dashboard on synthetic shelves and writes a JSON report
+#
+#   python benchmarks/run.py --sizes 1000 10000 100000 --report bench_report.json
+#   python benchmarks/run.py --baseline previous.json   # exits 1 on regressions
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+# time the builds themselves, not reads from a warm disk cache
+os.environ.setdefault("BOOKSHELF_DISK_CACHE", "off")
+
+import app
+from author_cloud import author_cloud, cloud_cache
+from catalog import BookCatalog
+from charts import build_figures, figure_cache
+from filters import FilterEngine
+from loader import prepare_books
+from pace import ReadingPace
+from recommend import Recommender
+from search import SearchIndex
+from series import SeriesIndex
+from synthetic import VOCABULARY, synthetic_shelf
+
+BENCH_MONTH = "March"
+
+
+def stage_load(raw, df):
+    prepare_books(raw)
+
+
+def stage_engine_build(raw, df):
+    FilterEngine(df)
+
+
+def stage_sidebar(raw, df):
+    engine = FilterEngine(df)
+    start = time.perf_counter()
+    app.display_sidebar(engine)
+    return time.perf_counter() - start
+
+
+# month, genre and author picked in the sidebar cascade, then the page cap
+def stage_filter(raw, df):
+    genre = df["Genre"].value_counts().idxmax()
+    author = df["Author"].value_counts().idxmax()
+    engine = FilterEngine(df)
+    start = time.perf_counter()
+    state = engine.start(BENCH_MONTH)
+    state.options("Genre")
+    state = state.narrow("Genre", [genre])
+    state.options("Author")
+    state = state.narrow("Author", [author])
+    state.max_pages()
+    state.view(500)
+    return time.perf_counter() - start
+
+
+def stage_catalog_build(raw, df):
+    BookCatalog(df)
+
+
+def stage_lookup(raw, df):
+    book_ids = df.index.to_series().sample(1000, replace=True, random_state=0)
+    catalog = BookCatalog(df)
+    start = time.perf_counter()
+    for book_id in book_ids:
+        catalog.by_id(book_id)
+    return time.perf_counter() - start
+
+
+def stage_month_figures(raw, df):
+    month_df = FilterEngine(df).start(BENCH_MONTH).view()
+    figure_cache.clear()
+    build_figures(BENCH_MONTH, month_df)
+
+
+def stage_year_figures(raw, df):
+    figure_cache.clear()
+    build_figures("Entire Year", df)
+
+
+def stage_word_cloud(raw, df):
+    cloud_cache.clear()
+    author_cloud(df["Author"])
+
+
+def stage_pace(raw, df):
+    pace = ReadingPace(df)
+    pace.rolling()
+    pace.summary()
+
+
+def stage_series_build(raw, df):
+    SeriesIndex(df)
+
+
+# one row per series for a month, as the charts and cards ask for it
+def stage_series_group(raw, df):
+    series = SeriesIndex(df)
+    month_df = df[df["Month"] == BENCH_MONTH]
+    start = time.perf_counter()
+    series.group(month_df)
+    return time.perf_counter() - start
+
+
+# the benchmark shelf is read against a fixed 100k-book candidate file
+def recommend_candidates():
+    global RECOMMEND_CANDIDATES
+    if RECOMMEND_CANDIDATES is None:
+        RECOMMEND_CANDIDATES = synthetic_shelf(100_000, seed=1).assign(Title=lambda df: "Candidate " + df["Title"])
+    return RECOMMEND_CANDIDATES
+
+
+RECOMMEND_CANDIDATES = None
+
+
+def stage_recommend_build(raw, df):
+    candidates = recommend_candidates()
+    start = time.perf_counter()
+    Recommender(df, candidates)
+    return time.perf_counter() - start
+
+
+# 100 different profiles, one per month and genre pick
+def stage_recommend_query(raw, df):
+    recommender = Recommender(df, recommend_candidates())
+    engine = FilterEngine(df)
+    selections = [tuple(engine.start(month).narrow("Genre", [genre]).view().index) for month in engine.start().options("Month") for genre in engine.start().options("Genre")][:100]
+    start = time.perf_counter()
+    for book_ids in selections:
+        recommender.recommend(book_ids, 10)
+    return time.perf_counter() - start
+
+
+def stage_search_build(raw, df):
+    SearchIndex(df, ":memory:")
+
+
+# 1% of the reviews rewritten, only those are re-indexed
+def stage_search_update(raw, df):
+    index = SearchIndex(df, ":memory:")
+    edited = df.copy()
+    edited.loc[edited.index[::100], "Thoughts"] = "Edited thoughts after a second read."
+    start = time.perf_counter()
+    index.sync(edited)
+    return time.perf_counter() - start
+
+
+# two topical words per query, drawn uniformly from the review vocabulary
+def stage_search_query(raw, df):
+    rng = random.Random(0)
+    queries = [" ".join(rng.sample(VOCABULARY, 2)) for _ in range(100)]
+    index = SearchIndex(df, ":memory:")
+    month_rows = FilterEngine(df).start(BENCH_MONTH).view().index
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, month_rows)
+    return time.perf_counter() - start
+
+
+STAGES = {
+    "load": stage_load,
+    "engine_build": stage_engine_build,
+    "sidebar": stage_sidebar,
+    "filter": stage_filter,
+    "catalog_build": stage_catalog_build,
+    "lookup_1000": stage_lookup,
+    "month_figures": stage_month_figures,
+    "year_figures": stage_year_figures,
+    "word_cloud": stage_word_cloud,
+    "pace": stage_pace,
+    "series_build": stage_series_build,
+    "series_group": stage_series_group,
+    "recommend_build": stage_recommend_build,
+    "recommend_query_100": stage_recommend_query,
+    "search_build": stage_search_build,
+    "search_update": stage_search_update,
+    "search_query_100": stage_search_query,
+}
+
+# figures colour every title separately, so they stay off by default at large sizes
+DEFAULT_STAGES = ["load", "engine_build", "sidebar", "filter", "catalog_build", "lookup_1000", "month_figures", "word_cloud", "pace", "series_build", "series_group"]
+
+
+# median seconds, stages may return their own timing to exclude setup
+def measure(stage, raw, df, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        elapsed = stage(raw, df)
+        timings.append(elapsed if elapsed is not None else time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path) as file:
+        baseline = {(row["size"], row["stage"]): row["seconds"] for row in json.load(file)["results"]}
+
+    regressions = []
+    for row in results:
+        before = baseline.get((row["size"], row["stage"]))
+        if before and row["seconds"] > before * (1 + tolerance):
+            regressions.append((row["size"], row["stage"], before, row["seconds"]))
+
+    for size, stage, before, after in regressions:
+        print(f"REGRESSION {stage} @ {size}: {before:.4f}s -> {after:.4f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=DEFAULT_STAGES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", default="bench_report.json")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging a regression")
+    args = parser.parse_args()
+
+    # bare-mode widget calls warn about the missing script context on every call
+    logging.disable(logging.WARNING)
+
+    results = []
+    for size in args.sizes:
+        raw = synthetic_shelf(size, seed=args.seed)
+        df = prepare_books(raw)
+        for name in args.stages:
+            seconds = measure(STAGES[name], raw, df, args.repeats)
+            results.append({"size": size, "stage": name, "seconds": seconds})
+            print(f"{size:>9} {name:>14} {seconds:10.4f}s")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeats": args.repeats,
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.report, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
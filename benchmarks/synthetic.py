@@ -0,0 +1,109 @@
+# synthetic shelves shaped like data/shelf/2024.csv
+#
+#   python benchmarks/synthetic.py 100000 --out /tmp/shelf_100k.csv
+import argparse
+import calendar
+
+import numpy as np
+import pandas as pd
+
+GENRES = ["Fantasy", "Science Fiction", "Action", "Nonfiction", "Sports", "Drama", "Romance", "Mystery", "Horror", "Poetry"]
+LANGUAGES = ["English", "Japanese", "Korean", "Spanish", "French"]
+# review text is drawn from a fixed vocabulary so full-text search has something to rank
+VOCABULARY = [f"term{i}" for i in range(5000)]
+REVIEW_WORDS = 40
+COVERS = ["img/jjk_10.jpg", "img/tef_book.jpg", "img/acotar_book.jpg", "img/co_book.jpg", "img/g1.jpg"]
+# share of books that belong to a numbered run, and the longest run
+SERIES_SHARE = 0.4
+MAX_VOLUMES = 12
+
+
+# zipf-like weights, skew=0 is uniform
+def skewed_weights(count: int, skew: float) -> np.ndarray:
+    weights = 1 / np.arange(1, count + 1) ** skew
+    return weights / weights.sum()
+
+
+def synthetic_text(rng: np.random.Generator, size: int, words: int = REVIEW_WORDS) -> list:
+    picks = rng.choice(VOCABULARY, (size, words), p=skewed_weights(len(VOCABULARY), 1.0))
+    return [" ".join(row) for row in picks]
+
+
+# run number and volume per book in reading order, -1 for standalones; a run's volumes are read in order
+def synthetic_runs(rng: np.random.Generator, size: int, share: float = SERIES_SHARE) -> tuple:
+    members = np.flatnonzero(rng.random(size) < share)
+    lengths = rng.integers(2, MAX_VOLUMES + 1, max(1, len(members)))
+    ends = np.cumsum(lengths)
+    run_of = np.searchsorted(ends, np.arange(len(members)), side="right")
+
+    runs = np.full(size, -1)
+    volumes = np.zeros(size, dtype=int)
+    runs[members] = run_of
+    volumes[members] = np.arange(len(members)) - (ends - lengths)[run_of] + 1
+    return runs, volumes
+
+
+def synthetic_shelf(size: int, seed: int = 0, authors: int = 2000, genre_skew: float = 1.0,
+                    author_skew: float = 1.1, language_skew: float = 1.5,
+                    start: str = "2024-01-01", end: str = "2024-12-31", max_days: int = 21,
+                    series_share: float = SERIES_SHARE) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    first_day, last_day = pd.Timestamp(start), pd.Timestamp(end)
+    span = (last_day - first_day).days + 1
+    end_dates = first_day + pd.to_timedelta(rng.integers(0, span, size), unit="D")
+    start_dates = end_dates - pd.to_timedelta(rng.integers(0, max_days, size), unit="D")
+
+    author_names = np.array([f"Author {i}" for i in range(min(authors, size))])
+    covers = rng.integers(0, len(COVERS), size)
+    df = pd.DataFrame({
+        "Month": np.array(calendar.month_name)[end_dates.month],
+        "Title": [f"Synthetic Book {i}" for i in range(size)],
+        "Author": rng.choice(author_names, size, p=skewed_weights(len(author_names), author_skew)),
+        "Genre": rng.choice(GENRES, size, p=skewed_weights(len(GENRES), genre_skew)),
+        "Language": rng.choice(LANGUAGES, size, p=skewed_weights(len(LANGUAGES), language_skew)),
+        "Start Date": start_dates.strftime("%m-%d-%Y"),
+        "End Date": end_dates.strftime("%m-%d-%Y"),
+        "Rating": rng.choice([3, 3.5, 4, 4.5, 5], size, p=[.05, .1, .25, .25, .35]),
+        "Pages": rng.integers(120, 900, size),
+        "Cover": np.array(COVERS)[covers],
+        "Cover Width": 250,
+        "Summary": synthetic_text(rng, size),
+        "Thoughts": synthetic_text(rng, size),
+    })
+
+    # rows are stored in reading order like the real shelf
+    order = np.argsort(end_dates.to_numpy(), kind="stable")
+    df = df.iloc[order].reset_index(drop=True)
+
+    # standalones mixed with "#n" runs, every volume of a run by the author of its first
+    runs, volumes = synthetic_runs(rng, size, series_share)
+    members = np.flatnonzero(runs >= 0)
+    first = members[np.unique(runs[members], return_index=True)[1]]
+    df["Title"] = np.where(runs >= 0, [f"Synthetic Saga {run} #{volume}" for run, volume in zip(runs, volumes)], df["Title"])
+    df.loc[members, "Author"] = df["Author"].to_numpy()[first][runs[members]]
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("size", type=int)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--authors", type=int, default=2000)
+    parser.add_argument("--genre-skew", type=float, default=1.0)
+    parser.add_argument("--author-skew", type=float, default=1.1)
+    parser.add_argument("--language-skew", type=float, default=1.5)
+    parser.add_argument("--start", default="2024-01-01")
+    parser.add_argument("--end", default="2024-12-31")
+    parser.add_argument("--series-share", type=float, default=SERIES_SHARE)
+    args = parser.parse_args()
+
+    df = synthetic_shelf(args.size, seed=args.seed, authors=args.authors, genre_skew=args.genre_skew,
+                         author_skew=args.author_skew, language_skew=args.language_skew,
+                         start=args.start, end=args.end, series_share=args.series_share)
+    df.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+import streamlit as st
+
+from disk_cache import DiskStore, disk_cache
+
+
+# thread-safe LRU shared by every session, bounded by entries and optionally by bytes, optionally backed by disk
+class SharedCache:
+    def __init__(self, name: str, maxsize: int, maxbytes: Optional[int] = None, sizeof: Optional[Callable] = None, store: Optional[DiskStore] = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        # misses answered by the disk tier instead of a build
+        self.disk_hits = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        # key -> event of a build in flight, so concurrent sessions asking for the same value build it once
+        self._building = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._sizes[key]
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes and len(self._entries) > 1):
+                evicted, _ = self._entries.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+
+    # cached value, or build it once while other callers of the same key wait for it
+    def get_or_build(self, key, build: Callable):
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+                event = self._building.get(key)
+                if event is None:
+                    self.misses += 1
+                    event = self._building[key] = threading.Event()
+                    break
+            # another session is building it, take its result or build it ourselves if it failed
+            event.wait()
+
+        try:
+            value = self.store.get(key) if self.store is not None else None
+            if value is not None:
+                self.disk_hits += 1
+            else:
+                value = build()
+                if self.store is not None:
+                    self.store.put(key, value)
+            self.put(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._building[key]
+            event.set()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "Cache": self.name,
+            "Entries": len(self._entries),
+            "Max Entries": self.maxsize,
+            "MB": round(self.nbytes / 2**20, 2),
+            "Max MB": round(self.maxbytes / 2**20, 2) if self.maxbytes is not None else None,
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Hit Rate": round(self.hits / requests, 3) if requests else None,
+            "Disk Hits": self.disk_hits,
+            "Evictions": self.evictions,
+        }
+
+
+# every shared cache by name, for the stats table
+_caches = {}
+
+
+# one SharedCache per name for the whole process, held by st.cache_resource like the catalog
+def shared_cache(name: str, maxsize: int, maxbytes: Optional[int] = None, sizeof: Optional[Callable] = None, store: Optional[DiskStore] = None) -> SharedCache:
+    cache = _shared_cache(name, maxsize, maxbytes)
+    if sizeof is not None:
+        cache.sizeof = sizeof
+    if store is not None:
+        cache.store = store
+    _caches[name] = cache
+    return cache
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_cache(name: str, maxsize: int, maxbytes: Optional[int]) -> SharedCache:
+    return SharedCache(name, maxsize, maxbytes)
+
+
+# memory tiers first, then the disk cache they share
+def cache_stats() -> pd.DataFrame:
+    rows = [cache.stats() for cache in _caches.values()]
+    disk = disk_cache()
+    if disk is not None:
+        rows.append({"Cache": "disk", **disk.stats()})
+    return pd.DataFrame(rows).convert_dtypes()
@@ -0,0 +1,19 @@
+import pandas as pd
+
+
+# row-label indexed view over the book frame, the same labels the filtered views carry
+class BookCatalog:
+    def __init__(self, df: pd.DataFrame):
+        self._by_id = {}
+        for book_id, record in zip(df.index, df.to_dict(orient="records")):
+            record["ID"] = book_id
+            self._by_id[book_id] = record
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def by_id(self, book_id: int) -> dict:
+        return self._by_id[book_id]
@@ -0,0 +1,106 @@
+import hashlib
+import importlib
+import json
+import os
+
+import pandas as pd
+
+from caches import shared_cache
+from disk_cache import DiskStore
+from pace import ReadingPace
+from progress import ReadingProgress
+
+COLORS = ["#8da683", "#be8f3c", "#d99d29", "#f2dcb1", "#dc8920"]
+FIGURE_CACHE_SIZE = 32
+FIGURE_CACHE_BYTES = 64 * 2**20
+
+# columns the figures read, everything else is ignored when hashing
+CHART_COLUMNS = ["Title", "Author", "Genre", "Language", "Start Date", "End Date", "Rating", "Pages"]
+
+
+# books per language, in first-appearance order
+def language_counts(df: pd.DataFrame) -> pd.DataFrame:
+    counts = df['Language'].value_counts(sort=False)
+    counts = counts[counts > 0]
+    return pd.DataFrame({"Language": counts.index.astype(str), "# of Books": counts.to_numpy()})
+
+# reading time in days per book
+def book_durations(df: pd.DataFrame) -> pd.DataFrame:
+    duration = df['End Date'] - df['Start Date']
+    return df.assign(Duration=duration.dt.days).sort_values(by="Duration", ascending=False)
+
+
+# chart name -> builder, as "module:function" so plotly.express is only imported with the first figure
+YEAR_CHARTS = {
+    "language": "year_charts:language_chart",
+    "scatter": "year_charts:rating_scatter",
+    "progress": "year_charts:progress_chart",
+    "pace": "year_charts:pace_chart",
+}
+
+MONTH_CHARTS = {
+    "genre": "month_charts:genre_pie",
+    "pages": "month_charts:page_count_chart",
+    "duration": "month_charts:duration_chart",
+    "rating": "month_charts:rating_box",
+}
+
+# one bar or point per title, these take one row per series when series are grouped
+SERIES_CHARTS = {"scatter", "pages", "duration"}
+
+
+def chart_builder(path: str):
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+# books per reading year, from the yearly rollups
+def year_over_year_chart(rollups: pd.DataFrame):
+    return chart_builder("year_charts:year_over_year_chart")(rollups)
+
+
+# figures as Plotly JSON on disk, a restart reads them back instead of building them again
+def figures_to_json(figures: dict) -> bytes:
+    return json.dumps({name: figure.to_json() for name, figure in figures.items()}).encode()
+
+
+def figures_from_json(data: bytes) -> dict:
+    import plotly.io as pio
+    return {name: pio.from_json(figure, skip_invalid=True) for name, figure in json.loads(data).items()}
+
+
+FIGURE_SOURCES = tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name) for name in ("charts.py", "year_charts.py", "month_charts.py", "pace.py", "progress.py"))
+
+# finished figures, shared by every session, 200 viewers of one month build its figures once
+# sized by their Plotly JSON, the same bytes the disk tier stores
+figure_cache = shared_cache("figures", FIGURE_CACHE_SIZE, maxbytes=FIGURE_CACHE_BYTES, sizeof=lambda figures: len(figures_to_json(figures)), store=DiskStore("figures", figures_to_json, figures_from_json, FIGURE_SOURCES))
+
+
+# hash of the filtered rows plus the selected view
+def figure_key(selected_month: str, df: pd.DataFrame) -> str:
+    digest = hashlib.sha1(selected_month.encode())
+    digest.update(df.index.to_numpy().tobytes())
+    # raw column buffers, every session hashes its rows on each rerun so this stays cheaper than hash_pandas_object
+    for column in CHART_COLUMNS:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            digest.update(values.cat.codes.to_numpy().tobytes())
+            digest.update("\0".join(map(str, values.cat.categories)).encode())
+        elif isinstance(values.dtype, pd.StringDtype):
+            digest.update("\0".join(values.fillna("").tolist()).encode())
+        else:
+            digest.update(values.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# builds every figure for a view, reusing cached ones when nothing changed
+def build_figures(selected_month: str, df: pd.DataFrame, progress: ReadingProgress = None, summary: dict = None, pace: ReadingPace = None, grouped: pd.DataFrame = None) -> dict:
+    key = figure_key(selected_month, df) if grouped is None else figure_key(f"{selected_month} by series", df)
+
+    def build_all():
+        charts = {name: chart_builder(path) for name, path in (YEAR_CHARTS if selected_month == "Entire Year" else MONTH_CHARTS).items()}
+        overrides = {"progress": {"progress": progress}, "language": {"summary": summary}, "genre": {"summary": summary}, "pace": {"pace": pace}}
+        frames = {name: grouped for name in SERIES_CHARTS} if grouped is not None else {}
+        return {name: build(frames.get(name, df), **overrides.get(name, {})) for name, build in charts.items()}
+
+    return figure_cache.get_or_build(key, build_all)
@@ -0,0 +1,74 @@
+import hashlib
+import io
+import os
+from functools import lru_cache
+
+from PIL import Image, features
+
+from caches import shared_cache
+from storage import write_atomic
+
+CACHE_DIR = ".cache/covers"
+
+# thumbnails are rendered at twice the display width for high-DPI screens
+PIXEL_DENSITY = 2
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+# thumbnail bytes held in memory for every session, the disk cache backs it
+thumbnail_cache = shared_cache("thumbnails", 1024, maxbytes=64 * 2**20, sizeof=len)
+
+
+def thumbnail_format() -> str:
+    return "WEBP" if features.check("webp") else "JPEG"
+
+
+# cover resized for a display width, generated once, then read from memory or the on-disk cache
+def cover_thumbnail(path: str, width: int) -> bytes:
+    stat = os.stat(path)
+    cache_path = _thumbnail_path(path, stat.st_mtime_ns, stat.st_size, width, thumbnail_format())
+    return thumbnail_cache.get_or_build(cache_path, lambda: _stored_thumbnail(path, width, cache_path))
+
+
+def _stored_thumbnail(path: str, width: int, cache_path: str) -> bytes:
+    try:
+        with open(cache_path, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        pass
+
+    data = _render_thumbnail(path, width)
+    write_atomic(cache_path, data)
+    return data
+
+
+# content-addressed location: hash of the source bytes plus the variant
+@lru_cache(maxsize=1024)
+def _thumbnail_path(path: str, mtime_ns: int, size: int, width: int, image_format: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        digest.update(file.read())
+    digest.update(f":{width * PIXEL_DENSITY}:{image_format}".encode())
+    return os.path.join(CACHE_DIR, f"{digest.hexdigest()}.{image_format.lower()}")
+
+
+def _render_thumbnail(path: str, width: int) -> bytes:
+    image_format = thumbnail_format()
+    target = width * PIXEL_DENSITY
+
+    with Image.open(path) as image:
+        image.load()
+        if image.width > target:
+            image = image.resize((target, round(image.height * target / image.width)), Image.LANCZOS)
+
+        if image_format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+
+        buffer = io.BytesIO()
+        if image_format == "WEBP":
+            image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=6)
+        else:
+            image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        return buffer.getvalue()
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+# values that outlive the process: parsed shelf frames, figure JSON and word cloud PNGs
+DISK_CACHE_PATH = ".cache/disk/cache.db"
+DISK_CACHE_BYTES = 256 * 2**20
+# BOOKSHELF_DISK_CACHE=off keeps everything in memory, e.g. on a read-only deploy
+DISK_CACHE_ENV = "BOOKSHELF_DISK_CACHE"
+
+logger = logging.getLogger(__name__)
+
+
+# SQLite table of blobs, least recently read entries are evicted past maxbytes
+class DiskCache:
+    def __init__(self, path: str = DISK_CACHE_PATH, maxbytes: int = DISK_CACHE_BYTES):
+        self.path = path
+        self.maxbytes = maxbytes
+        # one connection per thread, WAL lets sessions and the warm CLI read while another writes
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._connection() as connection:
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: bytes):
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (key, value, len(value), time.time()))
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            # oldest reads go first until the table fits again, the entry just written stays
+            for old_key, size in connection.execute("SELECT key, size FROM entries WHERE key != ? ORDER BY accessed", (key,)).fetchall():
+                if total <= self.maxbytes:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                total -= size
+
+    def stats(self) -> dict:
+        with self._connection() as connection:
+            entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"Entries": entries, "MB": round(size / 2**20, 2), "Max MB": round(self.maxbytes / 2**20, 2)}
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entries")
+
+
+# one kind of value in the disk cache: how to write it and which source files it depends on
+class DiskStore:
+    def __init__(self, namespace: str, dumps: Callable, loads: Callable, sources: tuple = ()):
+        self.namespace = namespace
+        self.dumps = dumps
+        self.loads = loads
+        # editing the code that builds a value retires what the old code stored
+        self.prefix = f"{namespace}:{source_version(sources)}:"
+
+    def _key(self, key) -> str:
+        return self.prefix + hashlib.sha1(repr(key).encode()).hexdigest()
+
+    # a broken or missing cache file is a miss, never an error on the page
+    def get(self, key):
+        cache = disk_cache()
+        if cache is None:
+            return None
+        try:
+            data = cache.get(self._key(key))
+            return self.loads(data) if data is not None else None
+        except Exception:
+            logger.warning("disk cache read failed for %s", self.namespace, exc_info=True)
+            return None
+
+    def put(self, key, value):
+        cache = disk_cache()
+        if cache is None:
+            return
+        try:
+            cache.put(self._key(key), self.dumps(value))
+        except Exception:
+            logger.warning("disk cache write failed for %s", self.namespace, exc_info=True)
+
+    def get_or_build(self, key, build: Callable):
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+
+_lock = threading.Lock()
+_disk_cache = None
+
+
+# the process-wide disk cache, None when switched off
+def disk_cache() -> Optional[DiskCache]:
+    global _disk_cache
+    if os.environ.get(DISK_CACHE_ENV, "").lower() in ("0", "off", "false"):
+        return None
+    with _lock:
+        if _disk_cache is None:
+            _disk_cache = DiskCache()
+        return _disk_cache
+
+
+# digest of the source files a cached value is built by
+@lru_cache(maxsize=64)
+def source_version(sources: tuple) -> str:
+    digest = hashlib.sha1()
+    for source in sources:
+        with open(source, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:12]
+
+
+# digest of a data file's bytes, unlike its mtime it survives a fresh checkout
+@lru_cache(maxsize=256)
+def file_digest(path: str, version: tuple) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(2**20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
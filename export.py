@@ -0,0 +1,222 @@
+# pre-renders the bookshelf as static HTML, one page per month plus the Entire Year view
+#
+#   python export.py --out site
+#   python export.py --out site --years 2023 2024
+import argparse
+import hashlib
+import html
+import logging
+import os
+
+import plotly.offline
+
+from author_cloud import author_cloud
+from charts import build_figures, year_over_year_chart
+from covers import cover_thumbnail, thumbnail_format
+from loader import load_catalog, load_filter_engine, load_progress, shelf_years
+from notes import month_note
+from pace import ReadingPace
+from rollups import load_rollup_cube, load_year_rollups
+from storage import write_atomic
+
+ASSET_DIR = "assets"
+
+# same chart order and columns as display_charts
+YEAR_LAYOUT = [["language", "scatter"], ["progress", "cloud"]]
+MONTH_LAYOUT = [["genre", "pages"], ["duration", "rating"]]
+CHART_TITLES = {
+    "language": "Language Distribution in Books",
+    "scatter": "Book Ratings vs. Page Count",
+    "progress": "Reading Progress Over Time",
+    "cloud": "Author Word Cloud",
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="{root}{asset_dir}/plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; margin: 2rem auto; max-width: 1100px; padding: 0 1rem; color: #31333f; }}
+nav a {{ margin-right: .75rem; }}
+nav a.current {{ font-weight: bold; }}
+.metrics, .columns {{ display: flex; gap: 2rem; flex-wrap: wrap; }}
+.metric {{ flex: 1; }}
+.metric .value {{ font-size: 2rem; }}
+.column {{ flex: 1; min-width: 350px; }}
+details {{ border: 1px solid #ddd; border-radius: .5rem; margin: .5rem 0; padding: .5rem 1rem; }}
+summary {{ cursor: pointer; }}
+.card {{ display: flex; gap: 2rem; flex-wrap: wrap; }}
+</style>
+</head>
+<body>
+<nav>{nav}</nav>
+<h1>📚 {title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+# writes the site for the given years and returns the written page paths
+def export_site(out_dir: str, years: list = None) -> list:
+    years = sorted(years or shelf_years())
+    os.makedirs(os.path.join(out_dir, ASSET_DIR), exist_ok=True)
+    write_atomic(os.path.join(out_dir, ASSET_DIR, "plotly.min.js"), plotly.offline.get_plotlyjs().encode())
+
+    year_rollups = load_year_rollups() if len(shelf_years()) > 1 else None
+    pages = []
+    for year in years:
+        pages += export_year(out_dir, year, years, year_rollups)
+
+    # the site root opens the latest year
+    index_path = os.path.join(out_dir, "index.html")
+    write_atomic(index_path, f'<!DOCTYPE html><meta http-equiv="refresh" content="0; url={years[-1]}/index.html">'.encode())
+    return pages + [index_path]
+
+
+def export_year(out_dir: str, year: int, years: list, year_rollups=None) -> list:
+    catalog = load_catalog([year])
+    engine = load_filter_engine([year])
+    progress = load_progress([year])
+    cube = load_rollup_cube([year])
+
+    views = ["Entire Year"] + engine.start().options("Month")
+    year_dir = os.path.join(out_dir, str(year))
+
+    pages = []
+    for view in views:
+        state = engine.start(None if view == "Entire Year" else view)
+        df = state.view()
+
+        note = month_note(year, engine, view)
+        if note is not None:
+            body = f"<p>{html.escape(note)}</p>"
+        else:
+            summary = cube.summarize(state)
+            body = render_metrics(summary) + render_charts(view, df, out_dir, progress, summary)
+            if view != "Entire Year":
+                body += render_cards(df, catalog, out_dir)
+            elif year_rollups is not None:
+                body += "<p><b>Year over Year</b></p>" + render_figure("year-over-year", year_over_year_chart(year_rollups))
+
+        path = os.path.join(year_dir, page_name(view))
+        nav = render_nav(year, years, views, view)
+        page = PAGE_TEMPLATE.format(title=f"{year} Bookshelf", root="../", asset_dir=ASSET_DIR, nav=nav, body=body)
+        write_atomic(path, page.encode())
+        pages.append(path)
+
+    return pages
+
+
+def page_name(view: str) -> str:
+    return "index.html" if view == "Entire Year" else f"{view.lower()}.html"
+
+
+def render_nav(year: int, years: list, views: list, current: str) -> str:
+    links = [f'<a href="../{other}/index.html"{" class=current" if other == year and current == "Entire Year" else ""}>{other}</a>' for other in years]
+    links += [f'<a href="{page_name(view)}"{" class=current" if view == current else ""}>{view}</a>' for view in views[1:]]
+    return " ".join(links)
+
+
+def render_metrics(summary: dict) -> str:
+    tiles = [
+        ("Books Read", summary["Books"]),
+        ("Average Rating", summary["Average Rating"]),
+        ("Favorite Genre", summary["Genre Counts"].idxmax() if len(summary["Genre Counts"]) else "–"),
+    ]
+    return render_tiles(tiles)
+
+
+def render_tiles(tiles: list) -> str:
+    return '<div class="metrics">' + "".join(f'<div class="metric"><div>{label}</div><div class="value">{html.escape(str(value))}</div></div>' for label, value in tiles) + "</div>"
+
+
+def render_charts(view: str, df, out_dir: str, progress, summary: dict) -> str:
+    if not len(df):
+        return "<p>No data to display</p>"
+
+    pace = ReadingPace(df) if view == "Entire Year" else None
+    figures = build_figures(view, df, progress, summary, pace)
+    layout = YEAR_LAYOUT if view == "Entire Year" else MONTH_LAYOUT
+
+    columns = []
+    for names in layout:
+        parts = []
+        for name in names:
+            if name in CHART_TITLES:
+                parts.append(f"<p><b>{CHART_TITLES[name]}</b></p>")
+            if name == "cloud":
+                parts.append(f'<img src="../{write_asset(out_dir, author_cloud(df["Author"]), "png")}" alt="Author word cloud" style="max-width: 100%">')
+            else:
+                parts.append(render_figure(name, figures[name]))
+        columns.append('<div class="column">' + "".join(parts) + "</div>")
+    charts = '<div class="columns">' + "".join(columns) + "</div>"
+
+    if pace is not None:
+        pace_summary = pace.summary()
+        tiles = [
+            ("Pages per Day", pace_summary["Pages per Day"]),
+            ("Longest Streak", f"{pace_summary['Longest Streak']} days"),
+            ("Longest Gap", f"{pace_summary['Longest Gap']} days"),
+        ]
+        charts += "<p><b>Reading Pace</b></p>" + render_tiles(tiles) + render_figure("pace", figures["pace"])
+    return charts
+
+
+# figure spec embedded as JSON, drawn by plotly.js in the browser
+def render_figure(name: str, fig) -> str:
+    spec = fig.to_json().replace("</", "<\\/")
+    return f'<div id="chart-{name}"></div><script>(function () {{ var spec = {spec}; Plotly.newPlot("chart-{name}", spec.data, spec.layout, {{displaylogo: false}}); }})();</script>'
+
+
+def render_cards(df, catalog, out_dir: str) -> str:
+    cards = ["<h2>About</h2>"]
+    image_extension = thumbnail_format().lower()
+    for book_id in df.index:
+        book = catalog.by_id(book_id)
+        cover = write_asset(out_dir, cover_thumbnail(book["Cover"], book["Cover Width"]), image_extension)
+        fields = [
+            ("Title", book["Title"]),
+            ("Author", book["Author"]),
+            ("Genre", book["Genre"]),
+            ("Language", book["Language"]),
+            ("Number of Pages", book["Pages"]),
+            ("My Rating", f"{round(float(book['Rating']), 2)}/5.0"),
+        ]
+        cards.append(
+            f"<details><summary>{html.escape(book['Title'])}</summary>"
+            f'<div class="card"><img src="../{cover}" width="{book["Cover Width"]}" alt="{html.escape(book["Title"])} cover">'
+            "<div>" + "".join(f"<p><b>{label}:</b> {html.escape(str(value))}</p>" for label, value in fields) + "</div></div>"
+            f"<p><b>Summary:</b> {html.escape(str(book['Summary']))}</p>"
+            f"<p><b>Thoughts:</b> {html.escape(str(book['Thoughts']))}</p></details>"
+        )
+    return "".join(cards)
+
+
+# content-addressed asset file, identical images are written once and cache forever on a CDN
+def write_asset(out_dir: str, data: bytes, extension: str) -> str:
+    relative = f"{ASSET_DIR}/{hashlib.sha256(data).hexdigest()[:20]}.{extension}"
+    path = os.path.join(out_dir, relative)
+    if not os.path.exists(path):
+        write_atomic(path, data)
+    return relative
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="site")
+    parser.add_argument("--years", type=int, nargs="+", help="defaults to every year on the shelf")
+    args = parser.parse_args()
+
+    # bare-mode cache and page config calls warn about the missing Streamlit runtime
+    logging.disable(logging.WARNING)
+
+    pages = export_site(args.out, args.years)
+    print(f"wrote {len(pages)} pages to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
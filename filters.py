@@ -0,0 +1,100 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ["Month", "Genre", "Author"]
+
+
+# per-value row lists over the categorical columns, built once per frame
+class FilterEngine:
+    def __init__(self, df: pd.DataFrame, columns: List[str] = FILTER_COLUMNS):
+        self.df = df
+        self._pages = df["Pages"].to_numpy()
+        self._max_pages = self._pages.max() if len(df) else 0
+        self._codes = {}
+        self._values = {}
+        self._rows = {}
+        self._options = {}
+
+        for column in columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                codes, values = df[column].cat.codes.to_numpy(), df[column].cat.categories
+            else:
+                codes, values = pd.factorize(df[column])
+
+            # row positions for every value, each list stays in row order
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes[codes >= 0], minlength=len(values))
+            splits = np.split(order[len(order) - counts.sum():], np.cumsum(counts)[:-1])
+
+            self._codes[column] = codes
+            self._values[column] = values
+            self._rows[column] = dict(zip(values, splits))
+            self._options[column] = _first_seen(codes, values)
+
+    def start(self, month: Optional[str] = None) -> "FilterState":
+        state = FilterState(self, None)
+        return state.narrow("Month", [month]) if month is not None else state
+
+
+# running selection, narrowed one column at a time without building frames
+class FilterState:
+    def __init__(self, engine: FilterEngine, rows: Optional[np.ndarray], filters: tuple = ()):
+        self.engine = engine
+        self.rows = rows
+        # (column, values) pairs applied so far, replayable on another engine
+        self.filters = filters
+
+    def narrow(self, column: str, values: List[str]) -> "FilterState":
+        if not values:
+            return self
+
+        engine = self.engine
+        if self.rows is None:
+            postings = [engine._rows[column].get(value, np.empty(0, dtype=np.intp)) for value in values]
+            rows = postings[0] if len(postings) == 1 else np.sort(np.concatenate(postings))
+        else:
+            lookup = np.zeros(len(engine._values[column]) + 1, dtype=bool)
+            lookup[engine._values[column].get_indexer(values)] = True
+            lookup[-1] = False
+            rows = self.rows[lookup[engine._codes[column][self.rows]]]
+
+        return FilterState(engine, rows, self.filters + ((column, tuple(values)),))
+
+    # same filters applied to another engine, e.g. over rollup cells
+    def replay(self, engine: FilterEngine) -> "FilterState":
+        state = FilterState(engine, None)
+        for column, values in self.filters:
+            state = state.narrow(column, list(values))
+        return state
+
+    def options(self, column: str) -> list:
+        if self.rows is None:
+            return self.engine._options[column]
+        return _first_seen(self.engine._codes[column][self.rows], self.engine._values[column])
+
+    def max_pages(self):
+        if self.rows is None:
+            return self.engine._max_pages
+        return self.engine._pages[self.rows].max() if len(self.rows) else 0
+
+    def capped(self, pages) -> bool:
+        return pages is not None and pages < self.max_pages()
+
+    def view(self, pages=None) -> pd.DataFrame:
+        engine = self.engine
+        rows = self.rows
+
+        if self.capped(pages):
+            rows = np.flatnonzero(engine._pages <= pages) if rows is None else rows[engine._pages[rows] <= pages]
+
+        return engine.df if rows is None else engine.df.iloc[rows]
+
+
+# distinct values in order of first appearance, like Series.unique
+def _first_seen(codes: np.ndarray, values: pd.Index) -> list:
+    present, first = np.unique(codes, return_index=True)
+    keep = present >= 0
+    present = present[keep][np.argsort(first[keep], kind="stable")]
+    return list(values[present])
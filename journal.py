@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+import uuid
+from typing import Optional
+
+import pandas as pd
+
+from schema import DATE_FORMAT, MONTHS
+
+# books added or edited in the app, one append-only log per reading month until compaction folds them into the shelf
+JOURNAL_DIR = "data/journal"
+# entries a year may collect before its logs are compacted
+COMPACT_AFTER = 25
+
+BOOK_FIELDS = ["Month", "Title", "Series", "Author", "Genre", "Language", "Start Date", "End Date", "Rating", "Pages", "Cover", "Cover Width", "Summary", "Thoughts", "Book ID"]
+REQUIRED_FIELDS = ["Title", "Author", "Genre", "Language", "Start Date", "End Date", "Rating", "Pages", "Cover"]
+
+# appends and compactions from every session of this process go through one lock, readers never take it
+lock = threading.Lock()
+
+
+# data/journal/2024-03.jsonl
+def log_path(year: int, month: str, journal_dir: str = JOURNAL_DIR) -> str:
+    return os.path.join(journal_dir, f"{year}-{MONTHS.index(month) + 1:02d}.jsonl")
+
+
+# year -> months with a log, in calendar order
+def logged_months(journal_dir: str = JOURNAL_DIR) -> dict:
+    logged = {}
+    if not os.path.isdir(journal_dir):
+        return logged
+
+    for name in sorted(os.listdir(journal_dir)):
+        stem, extension = os.path.splitext(name)
+        year, _, month = stem.partition("-")
+        if extension == ".jsonl" and year.isdigit() and month.isdigit() and 1 <= int(month) <= 12:
+            logged.setdefault(int(year), []).append(MONTHS[int(month) - 1])
+    return logged
+
+
+# (month, (mtime_ns, size)) per logged month of a year, part of the partition's cache key
+def log_versions(year: int, journal_dir: str = JOURNAL_DIR) -> tuple:
+    versions = []
+    for month in logged_months(journal_dir).get(year, []):
+        try:
+            stat = os.stat(log_path(year, month, journal_dir))
+        except FileNotFoundError:
+            continue
+        versions.append((month, (stat.st_mtime_ns, stat.st_size)))
+    return tuple(versions)
+
+
+# entries of one month in write order, from a byte offset such as an earlier log size
+# a torn last line from an interrupted write is skipped
+def read_log(year: int, month: str, journal_dir: str = JOURNAL_DIR, start: int = 0) -> list:
+    try:
+        with open(log_path(year, month, journal_dir), "rb") as file:
+            file.seek(start)
+            lines = file.read().decode("utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+
+    entries = []
+    for number, line in enumerate(lines):
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            if number != len(lines) - 1:
+                raise
+    return entries
+
+
+# applies entries to a month of raw shelf rows: an edit replaces the book it names by ID, a new book is added at the end
+# columns outside BOOK_FIELDS, e.g. Series, are kept through an edit and carried over from an entry that has them
+def replay(df: pd.DataFrame, entries: list) -> pd.DataFrame:
+    rows = df.to_dict(orient="records")
+    columns = list(df.columns) if len(df.columns) else list(BOOK_FIELDS)
+    positions = {row["Book ID"]: position for position, row in enumerate(rows)}
+    for entry in entries:
+        book_id = entry.get("Replaces") or entry["Book ID"]
+        book = {**{field: value for field, value in entry.items() if field != "Replaces"}, "Book ID": book_id}
+        columns += [field for field in book if field not in columns]
+        # replaying an entry twice leaves the same rows, so a compaction racing a reader is harmless
+        position = positions.get(book_id)
+        if position is None:
+            positions[book_id] = len(rows)
+            rows.append(book)
+        else:
+            rows[position] = {**rows[position], **book}
+    return pd.DataFrame(rows, columns=columns)
+
+
+# the reading year and month a book is filed under, from its end date
+def book_period(book: dict) -> tuple:
+    end = pd.to_datetime(book["End Date"], format=DATE_FORMAT)
+    return end.year, MONTHS[end.month - 1]
+
+
+# appends one book to its month's log, returns (year, month)
+# a new book gets a fresh Book ID, an edit names the book it replaces with Replaces
+def append(book: dict, period: Optional[tuple] = None, journal_dir: str = JOURNAL_DIR) -> tuple:
+    missing = [field for field in REQUIRED_FIELDS if book.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
+    if pd.to_datetime(book["End Date"], format=DATE_FORMAT) < pd.to_datetime(book["Start Date"], format=DATE_FORMAT):
+        raise ValueError("End Date is before Start Date")
+
+    year, month = period or book_period(book)
+    if not book.get("Replaces"):
+        book = {**book, "Book ID": uuid.uuid4().hex[:12]}
+    # numpy scalars from a catalog record are written as plain numbers
+    line = json.dumps({**book, "Month": month}, ensure_ascii=False, default=lambda value: value.item()) + "\n"
+
+    with lock:
+        os.makedirs(journal_dir, exist_ok=True)
+        # one write of one line in append mode, then fsync so the entry survives a crash
+        handle = os.open(log_path(year, month, journal_dir), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            os.write(handle, line.encode("utf-8"))
+            os.fsync(handle)
+        finally:
+            os.close(handle)
+
+    return year, month
+
+
+# entries of a year not yet compacted
+def pending(year: int, journal_dir: str = JOURNAL_DIR) -> int:
+    return sum(len(read_log(year, month, journal_dir)) for month in logged_months(journal_dir).get(year, []))
+
+
+# drops a year's logs once the snapshot holds their entries
+def clear(year: int, months: list, journal_dir: str = JOURNAL_DIR):
+    for month in months:
+        try:
+            os.remove(log_path(year, month, journal_dir))
+        except FileNotFoundError:
+            pass
+
+
+# folds the logs into the shelf snapshots by hand, the app does this on its own every COMPACT_AFTER entries
+#
+#   python journal.py
+#   python journal.py --years 2024
+def main():
+    import argparse
+
+    from loader import compact_partition
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", nargs="+", type=int, help="years to compact, every logged year by default")
+    args = parser.parse_args()
+
+    for year in args.years or list(logged_months()):
+        print(f"{year}: {compact_partition(year)}")
+
+
+if __name__ == "__main__":
+    main()
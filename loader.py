@@ -0,0 +1,281 @@
+import io
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+import pandas as pd
+import streamlit as st
+
+import journal
+from catalog import BookCatalog
+from disk_cache import DiskStore, file_digest
+from filters import FilterEngine
+from progress import ReadingProgress
+from recommend import CANDIDATES_PATH, Recommender
+from schema import DATE_FORMAT, MONTHS, enforce_schema
+from search import SearchIndex
+from series import SeriesIndex
+from storage import write_atomic
+
+# one file per reading year, e.g. data/shelf/2024.csv or data/shelf/2025.parquet
+SHELF_DIR = "data/shelf"
+SOURCE_EXTENSIONS = (".csv", ".parquet", ".db", ".sqlite", ".sqlite3")
+SQLITE_TABLE = "books"
+# a year that only has logs gets a CSV snapshot like the shipped shelf
+SNAPSHOT_EXTENSION = ".csv"
+# parsed snapshots by file content, so a redeploy with fresh mtimes still starts warm
+snapshot_store = DiskStore("snapshots", pickle.dumps, pickle.loads, tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name) for name in ("loader.py", "schema.py")))
+
+# versions and year selections kept per loader, every logged book makes a new version
+CACHED_VERSIONS = 16
+
+
+# reads the raw shelf from a CSV, Parquet or SQLite file
+def read_source(path: str) -> pd.DataFrame:
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        return pd.read_csv(path)
+    if extension == ".parquet":
+        return pd.read_parquet(path)
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        with sqlite3.connect(path) as connection:
+            return pd.read_sql_query(f"SELECT * FROM {SQLITE_TABLE}", connection)
+
+    raise ValueError(f"Unsupported book source '{path}'")
+
+
+# coerces the raw shelf to the compact schema once, right after reading
+def prepare_books(df: pd.DataFrame) -> pd.DataFrame:
+    return enforce_schema(df)
+
+
+# changes whenever the file is rewritten, used as the cache key
+def file_version(path: str) -> tuple:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# writes rows back in the file's own format, so compaction never swaps a shelf file for another kind
+def write_source(df: pd.DataFrame, path: str):
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        dates = {column: df[column].dt.strftime(DATE_FORMAT) for column in df if pd.api.types.is_datetime64_any_dtype(df[column])}
+        with sqlite3.connect(path) as connection:
+            df.assign(**dates).to_sql(SQLITE_TABLE, connection, if_exists="replace", index=False)
+        return
+
+    buffer = io.BytesIO()
+    if extension == ".parquet":
+        df.to_parquet(buffer, index=False)
+    else:
+        df.to_csv(buffer, index=False, date_format=DATE_FORMAT)
+    write_atomic(path, buffer.getvalue())
+
+
+# year -> partition file, only the directory listing is read
+def shelf_partitions(shelf_dir: str = SHELF_DIR) -> dict:
+    partitions = {}
+    for name in os.listdir(shelf_dir):
+        stem, extension = os.path.splitext(name)
+        if stem.isdigit() and extension.lower() in SOURCE_EXTENSIONS:
+            partitions[int(stem)] = os.path.join(shelf_dir, name)
+    # a year logged in the app before it has a snapshot
+    for year in journal.logged_months():
+        partitions.setdefault(year, os.path.join(shelf_dir, f"{year}{SNAPSHOT_EXTENSION}"))
+    return dict(sorted(partitions.items()))
+
+
+def shelf_years(shelf_dir: str = SHELF_DIR) -> list:
+    return list(shelf_partitions(shelf_dir))
+
+
+# snapshot file version plus the version of every month logged since the last compaction
+def partition_version(year: int, path: str) -> tuple:
+    return (file_version(path) if os.path.exists(path) else None), journal.log_versions(year)
+
+
+# (year, path, version) for the requested years, the latest year when none are given
+def partition_key(years: Optional[Iterable[int]] = None, shelf_dir: str = SHELF_DIR) -> tuple:
+    partitions = shelf_partitions(shelf_dir)
+    years = sorted(set(years)) if years else list(partitions)[-1:]
+    return tuple((year, partitions[year], partition_version(year, partitions[year])) for year in years)
+
+
+# rows saved before books had IDs are numbered by year and position, compaction writes those numbers out
+def assign_book_ids(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    numbered = pd.Series([f"{year}-{position:04d}" for position in range(len(df))], index=df.index, dtype="string")
+    return df.assign(**{"Book ID": df["Book ID"].astype("string").fillna(numbered) if "Book ID" in df else numbered})
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHED_VERSIONS)
+def load_snapshot(year: int, path: str, version: Optional[tuple]) -> pd.DataFrame:
+    if version is None:
+        return prepare_books(pd.DataFrame(columns=journal.BOOK_FIELDS))
+    return snapshot_store.get_or_build((year, os.path.splitext(path)[1].lower(), file_digest(path, version)), lambda: prepare_books(assign_book_ids(read_source(path), year)))
+
+
+# one month of the snapshot with its log replayed, appending to a log only reloads that month
+@st.cache_data(show_spinner=False, max_entries=12 * CACHED_VERSIONS)
+def load_month(year: int, month: str, path: str, snapshot_version: Optional[tuple], log_version: Optional[tuple]) -> pd.DataFrame:
+    snapshot = load_snapshot(year, path, snapshot_version)
+    return journal.replay(snapshot[snapshot["Month"] == month], journal.read_log(year, month))
+
+
+# months of the snapshot and its logs in calendar order, so a month that only exists in the logs lands where it was read
+def partition_months(year: int, path: str, version: tuple) -> list:
+    snapshot_version, logs = version
+    months = set(load_snapshot(year, path, snapshot_version)["Month"].dropna()) | set(dict(logs))
+    return [month for month in MONTHS if month in months]
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHED_VERSIONS)
+def load_partition(year: int, path: str, version: tuple) -> pd.DataFrame:
+    snapshot_version, logs = version
+    df = load_snapshot(year, path, snapshot_version)
+
+    if logs:
+        logged = dict(logs)
+        months = partition_months(year, path, version)
+        df = prepare_books(pd.concat([load_month(year, month, path, snapshot_version, logged.get(month)) for month in months], ignore_index=True))
+
+    df = df.copy()
+    df.insert(0, "Year", pd.Series(year, index=df.index, dtype="int16"))
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHED_VERSIONS)
+def load_partitions(key: tuple) -> pd.DataFrame:
+    frames = [load_partition(*partition) for partition in key]
+    if len(frames) == 1:
+        return frames[0]
+    # categories differ per year, so the concat is coerced to the schema again
+    return prepare_books(pd.concat(frames, ignore_index=True))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_catalog(key: tuple) -> BookCatalog:
+    return BookCatalog(load_partitions(key))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_filter_engine(key: tuple) -> FilterEngine:
+    return FilterEngine(load_partitions(key))
+
+
+# newest progress of a year selection with the key and row count it was built for
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _progress_base(years: tuple) -> dict:
+    return {"lock": threading.Lock(), "key": None, "progress": None, "size": 0}
+
+
+# entries appended to a single month's log between two keys of one selection, None when anything else changed
+def appended_entries(previous: tuple, key: tuple) -> Optional[list]:
+    grown = []
+    for (year, path, (snapshot_version, logs)), (_, previous_path, (previous_snapshot, previous_logs)) in zip(key, previous):
+        if (path, snapshot_version) != (previous_path, previous_snapshot):
+            return None
+        before = dict(previous_logs)
+        if not set(before) <= set(dict(logs)):
+            return None
+        grown += [(year, month, before.get(month), version) for month, version in logs if before.get(month) != version]
+
+    if len(grown) != 1:
+        return None
+    year, month, before, after = grown[0]
+    start = before[1] if before is not None else 0
+    return journal.read_log(year, month, start=start) if after[1] > start else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_progress(key: tuple) -> ReadingProgress:
+    df = load_partitions(key)
+    base = _progress_base(tuple(year for year, _, _ in key))
+
+    with base["lock"]:
+        progress = None
+        # new books that landed after every row of the previous version are appended to it, anything else rebuilds;
+        # the previous key is never asked for again once its log has grown, so its progress is handed on instead of copied
+        entries = appended_entries(base["key"], key) if base["key"] is not None else None
+        if entries and not any(entry.get("Replaces") for entry in entries):
+            added = df.iloc[base["size"]:]
+            if list(added["Book ID"]) == [entry["Book ID"] for entry in entries]:
+                progress = base["progress"]
+                for label, end_date, pages in zip(added.index, added["End Date"], added["Pages"]):
+                    progress.append(label, end_date, int(pages))
+
+        if progress is None:
+            progress = ReadingProgress(df)
+        base.update(key=key, progress=progress, size=len(df))
+    return progress
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_search_index(key: tuple) -> SearchIndex:
+    return SearchIndex(load_partitions(key))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_series(key: tuple) -> SeriesIndex:
+    return SeriesIndex(load_partitions(key))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_recommender(key: tuple, candidates_path: str, candidates_version: tuple) -> Recommender:
+    return Recommender(load_partitions(key), read_source(candidates_path))
+
+
+# folds a year's logs into its shelf file, rewritten in place in its own format once the new rows are complete
+def compact_partition(year: int, shelf_dir: str = SHELF_DIR) -> str:
+    with journal.lock:
+        path = shelf_partitions(shelf_dir)[year]
+        months = journal.logged_months().get(year, [])
+        if not months:
+            return path
+
+        df = load_partition(year, path, partition_version(year, path))
+        write_source(df.drop(columns="Year"), path)
+        journal.clear(year, months)
+        return path
+
+
+# logs a new or edited book, compaction runs in the background once enough entries pile up
+def log_book(book: dict, period: Optional[tuple] = None) -> tuple:
+    year, month = journal.append(book, period)
+    if journal.pending(year) >= journal.COMPACT_AFTER:
+        threading.Thread(target=compact_partition, args=(year,), daemon=True).start()
+    return year, month
+
+
+def load_books(years: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    return load_partitions(partition_key(years))
+
+
+def load_catalog(years: Optional[Iterable[int]] = None) -> BookCatalog:
+    return _load_catalog(partition_key(years))
+
+
+def load_filter_engine(years: Optional[Iterable[int]] = None) -> FilterEngine:
+    return _load_filter_engine(partition_key(years))
+
+
+def load_progress(years: Optional[Iterable[int]] = None) -> ReadingProgress:
+    return _load_progress(partition_key(years))
+
+
+def load_search_index(years: Optional[Iterable[int]] = None) -> SearchIndex:
+    return _load_search_index(partition_key(years))
+
+
+def load_series(years: Optional[Iterable[int]] = None) -> SeriesIndex:
+    return _load_series(partition_key(years))
+
+
+# None when there is no candidates file next to the shelf
+def load_recommender(years: Optional[Iterable[int]] = None, candidates_path: str = CANDIDATES_PATH) -> Optional[Recommender]:
+    if not os.path.exists(candidates_path):
+        return None
+    return _load_recommender(partition_key(years), candidates_path, file_version(candidates_path))
@@ -0,0 +1,40 @@
+import pandas as pd
+import plotly.express as px
+
+from charts import COLORS, book_durations
+
+
+# genre dist
+def genre_pie(df: pd.DataFrame, summary: dict = None):
+    if summary is None:
+        fig = px.pie(df, names='Genre', title='Genre Distribution',  color_discrete_sequence=COLORS)
+    else:
+        counts = pd.DataFrame({"Genre": summary["Genre Counts"].index.astype(str), "# of Books": summary["Genre Counts"].to_numpy()})
+        fig = px.pie(counts, names='Genre', values='# of Books', title='Genre Distribution', color_discrete_sequence=COLORS)
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
+
+# page count
+def page_count_chart(df: pd.DataFrame):
+    df_sorted = df.sort_values(by="Pages", ascending=False)
+
+    fig = px.bar(x=df_sorted["Title"], y=df_sorted["Pages"], labels={'x':'Book Title', 'y':'Page Count'}, color=df_sorted["Title"], title='Page Count', color_discrete_sequence=COLORS)
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
+
+# duration chart
+def duration_chart(df: pd.DataFrame):
+    fig = px.bar(book_durations(df), x="Title", y="Duration", color="Title", title="Book Durations", labels={"Duration": "Days"}, color_discrete_sequence=COLORS)
+    fig.update_layout(barmode='stack')
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
+
+# rating spread
+def rating_box(df: pd.DataFrame):
+    fig = px.box(df, y='Rating', title='Book Ratings', color_discrete_sequence=COLORS)
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
@@ -0,0 +1,14 @@
+from typing import Optional
+
+from filters import FilterEngine
+
+# notes shown for months without any books
+month_notes = {
+    2024: {"May": "I was busy preparing and moving to an apartment, so no time for books..."},
+}
+
+
+# a month's note, only while the month has no books of its own
+def month_note(year: int, engine: FilterEngine, month: str) -> Optional[str]:
+    note = month_notes.get(year, {}).get(month)
+    return note if note is not None and not len(engine.start(month).view()) else None
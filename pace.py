@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+ROLLING_WINDOWS = (7, 30)
+
+
+# pages read per calendar day, each book spread evenly over the days it was open
+class ReadingPace:
+    def __init__(self, df: pd.DataFrame):
+        starts = df["Start Date"].to_numpy(dtype="datetime64[D]")
+        ends = df["End Date"].to_numpy(dtype="datetime64[D]")
+
+        if not len(df):
+            self.daily = pd.DataFrame({"Pages": [], "Books": []}, index=pd.DatetimeIndex([], name="Date"))
+            return
+
+        first = starts.min()
+        size = int((max(ends.max(), starts.max()) - first).astype(np.int64)) + 1
+        start_days = (starts - first).astype(np.int64)
+        end_days = np.maximum((ends - first).astype(np.int64), start_days)
+        rates = df["Pages"].to_numpy(dtype=float) / (end_days - start_days + 1)
+
+        # overlapping reads add up: +rate on the first day, -rate the day after the last, then a running sum
+        pages = np.cumsum(np.bincount(start_days, rates, size + 1) - np.bincount(end_days + 1, rates, size + 1))[:size]
+        books = np.cumsum(np.bincount(start_days, minlength=size + 1) - np.bincount(end_days + 1, minlength=size + 1))[:size]
+
+        self.daily = pd.DataFrame(
+            {"Pages": np.clip(pages.round(6), 0, None), "Books": books},
+            index=pd.date_range(pd.Timestamp(first), periods=size, freq="D", name="Date"),
+        )
+
+    def __len__(self):
+        return len(self.daily)
+
+    # mean pages per day over trailing windows, e.g. the 7- and 30-day pace
+    def rolling(self, windows=ROLLING_WINDOWS) -> pd.DataFrame:
+        return pd.DataFrame({f"{window}-Day Average": self.daily["Pages"].rolling(window, min_periods=1).mean() for window in windows})
+
+    # runs of consecutive days with at least one open book
+    def streaks(self) -> pd.DataFrame:
+        return _runs(self.daily["Books"].to_numpy() > 0, self.daily.index)
+
+    # runs of days without any open book, like a month with nothing read
+    def gaps(self) -> pd.DataFrame:
+        return _runs(self.daily["Books"].to_numpy() == 0, self.daily.index)
+
+    def summary(self) -> dict:
+        streaks, gaps = self.streaks(), self.gaps()
+        return {
+            "Pages per Day": round(float(self.daily["Pages"].mean()), 1) if len(self) else 0.0,
+            "Longest Streak": int(streaks["Days"].max()) if len(streaks) else 0,
+            "Longest Gap": int(gaps["Days"].max()) if len(gaps) else 0,
+        }
+
+
+# start, end and length of every run of True
+def _runs(mask: np.ndarray, dates: pd.DatetimeIndex) -> pd.DataFrame:
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return pd.DataFrame({"Start": dates[starts], "End": dates[ends], "Days": ends - starts + 1})
@@ -0,0 +1,147 @@
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from caches import cache_stats
+
+# ?profile=1 shows the timing panel and logs one JSON line per rerun, ?profile=cprofile also dumps cProfile stats
+PROFILE_PARAM = "profile"
+# same switch for a whole deployment, e.g. BOOKSHELF_PROFILE=cprofile
+PROFILE_ENV = "BOOKSHELF_PROFILE"
+PROFILE_DIR = ".cache/profiles"
+PROFILE_MODES = ("1", "true", "timings", "cprofile")
+
+# structured timing lines go to stderr next to Streamlit's own log
+logger = logging.getLogger("bookshelf.profile")
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# profiler of the rerun running on this thread, Streamlit runs every session on its own script thread
+_active = threading.local()
+# cProfile hooks the whole process (sys.monitoring on 3.12+), so only one rerun at a time may run it
+_cprofile_lock = threading.Lock()
+
+
+# wall time per stage of one rerun
+class RenderProfiler:
+    def __init__(self, session_id: str, cprofile: bool = False):
+        self.session_id = session_id
+        self.cprofile = cprofile
+        # cProfile was asked for but another rerun held it, this one has timings only
+        self.cprofile_busy = False
+        self.seconds = {}
+        self.calls = {}
+        # stages open right now, nested stages are reported as "charts › figures"
+        self._open = []
+        self._started = time.perf_counter()
+        self.total = None
+
+    @contextmanager
+    def stage(self, name: str):
+        self._open.append(name)
+        name = " › ".join(self._open)
+        # listed in the order stages open, so parents come before their nested stages
+        self.seconds.setdefault(name, 0.0)
+        self.calls.setdefault(name, 0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            self.calls[name] += 1
+            self._open.pop()
+
+    def stop(self):
+        self.total = time.perf_counter() - self._started
+
+    def breakdown(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "Stage": list(self.seconds),
+            "ms": [round(seconds * 1000, 1) for seconds in self.seconds.values()],
+            "Calls": list(self.calls.values()),
+        })
+
+    def record(self) -> dict:
+        return {
+            "session": self.session_id,
+            "total_ms": round(self.total * 1000, 1),
+            "stages": {name: round(seconds * 1000, 1) for name, seconds in self.seconds.items()},
+        }
+
+
+def profile_mode(query_params) -> str:
+    mode = query_params.get(PROFILE_PARAM) or os.environ.get(PROFILE_ENV, "")
+    return mode.lower() if mode.lower() in PROFILE_MODES else ""
+
+
+# starts profiling this rerun when the query param or environment flag asks for it
+def start(query_params) -> RenderProfiler:
+    mode = profile_mode(query_params)
+    if not mode:
+        _active.profiler = None
+        return None
+
+    ctx = get_script_run_ctx()
+    profiler = RenderProfiler(ctx.session_id if ctx else "bare", cprofile=mode == "cprofile")
+    if profiler.cprofile:
+        # one cProfile per session, the dump accumulates over its reruns
+        session_profile = st.session_state.setdefault("_cprofile", cProfile.Profile())
+        if _cprofile_lock.acquire(blocking=False):
+            try:
+                session_profile.enable()
+            except ValueError:
+                # some other profiler already hooks the process
+                _cprofile_lock.release()
+                profiler.cprofile, profiler.cprofile_busy = False, True
+        else:
+            profiler.cprofile, profiler.cprofile_busy = False, True
+    _active.profiler = profiler
+    return profiler
+
+
+# times a block of the current rerun, a no-op when profiling is off
+def stage(name: str):
+    profiler = getattr(_active, "profiler", None)
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+# stops the rerun's profiler, logs it and shows the breakdown in the sidebar
+def finish(profiler: RenderProfiler):
+    _active.profiler = None
+    if profiler is None:
+        return
+
+    profiler.stop()
+    if profiler.cprofile:
+        session_profile = st.session_state["_cprofile"]
+        try:
+            session_profile.disable()
+        finally:
+            _cprofile_lock.release()
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        session_profile.dump_stats(os.path.join(PROFILE_DIR, f"{profiler.session_id}.prof"))
+
+    logger.info(json.dumps(profiler.record(), ensure_ascii=False))
+
+    with st.sidebar.expander("Render timings", expanded=True):
+        st.caption(f"Rerun took {profiler.total * 1000:.1f} ms")
+        st.dataframe(profiler.breakdown(), hide_index=True)
+        if profiler.cprofile:
+            st.caption(f"cProfile stats: {PROFILE_DIR}/{profiler.session_id}.prof")
+        elif profiler.cprofile_busy:
+            st.caption("cProfile is running for another session, this rerun has timings only")
+        # process-wide, so the hit rate counts every session's reruns
+        st.caption("Shared caches")
+        st.dataframe(cache_stats(), hide_index=True)
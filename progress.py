@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+
+# cumulative pages ordered by End Date, kept as prefix sums so appends and filtered views stay cheap
+class ReadingProgress:
+    def __init__(self, df: pd.DataFrame):
+        order = np.argsort(df["End Date"].to_numpy(), kind="stable")
+        labels = df.index.to_numpy(dtype=np.int64)[order]
+        size = len(df)
+        capacity = max(16, size)
+
+        self._size = size
+        self._labels = np.zeros(capacity, dtype=np.int64)
+        self._dates = np.zeros(capacity, dtype="datetime64[ns]")
+        self._pages = np.zeros(capacity, dtype=np.int64)
+        self._prefix = np.zeros(capacity, dtype=np.int64)
+
+        self._labels[:size] = labels
+        self._dates[:size] = df["End Date"].to_numpy(dtype="datetime64[ns]")[order]
+        self._pages[:size] = df["Pages"].to_numpy()[order]
+        np.cumsum(self._pages[:size], out=self._prefix[:size])
+
+        # position of every row label in date order
+        self._rank = np.full(max(16, labels.max() + 1 if size else 0), -1, dtype=np.int64)
+        self._rank[labels] = np.arange(size)
+
+    def __len__(self):
+        return self._size
+
+    # adds one finished book, O(1) when it is the latest, otherwise only later entries shift
+    def append(self, label: int, end_date, pages: int):
+        size = self._size
+        if size == len(self._labels):
+            self._grow()
+        if label >= len(self._rank):
+            self._rank = np.concatenate([self._rank, np.full(max(label + 1, 2 * len(self._rank)) - len(self._rank), -1)])
+
+        end_date = np.datetime64(pd.Timestamp(end_date), "ns")
+        position = int(np.searchsorted(self._dates[:size], end_date, side="right"))
+        tail = slice(position + 1, size + 1)
+
+        self._labels[tail] = self._labels[position:size]
+        self._dates[tail] = self._dates[position:size]
+        self._pages[tail] = self._pages[position:size]
+        self._prefix[tail] = self._prefix[position:size] + pages
+        self._rank[self._labels[tail]] += 1
+
+        self._labels[position] = label
+        self._dates[position] = end_date
+        self._pages[position] = pages
+        self._prefix[position] = (self._prefix[position - 1] if position else 0) + pages
+        self._rank[label] = position
+        self._size = size + 1
+
+    # cumulative series for the whole shelf, or for the given row labels only
+    def series(self, labels=None) -> pd.DataFrame:
+        size = self._size
+        if labels is None or len(labels) == size:
+            dates, cumulative = self._dates[:size], self._prefix[:size]
+        else:
+            positions = np.sort(self._rank[np.asarray(labels, dtype=np.int64)])
+            dates = self._dates[positions]
+            if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+                # a contiguous date range, e.g. one month, is a difference of two prefix sums
+                start = positions[0]
+                cumulative = self._prefix[positions] - (self._prefix[start - 1] if start else 0)
+            else:
+                cumulative = np.cumsum(self._pages[positions])
+
+        return pd.DataFrame({"End Date": dates, "Cumulative Pages": cumulative})
+
+    def _grow(self):
+        capacity = 2 * len(self._labels)
+        for name in ("_labels", "_dates", "_pages", "_prefix"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
@@ -0,0 +1,118 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# books that could be read next, same columns as the shelf minus the reading log
+CANDIDATES_PATH = "data/candidates.csv"
+CANDIDATE_COLUMNS = ["Title", "Author", "Genre", "Language", "Pages"]
+
+# how much each kind of match counts towards the cosine similarity
+FEATURE_WEIGHTS = {"Author": 3.0, "Genre": 2.0, "Language": 1.0, "Length": 0.5}
+PAGE_BINS = [0, 150, 250, 400, 600, np.inf]
+PAGE_LABELS = ["Short", "Volume", "Novel", "Long", "Epic"]
+TOP_K = 10
+AUTHOR_SEPARATOR = re.compile(r",\s*|\s+&\s+")
+
+
+# cosine similarity between shelf books and candidates over sparse author/genre/language/length features
+class Recommender:
+    def __init__(self, shelf: pd.DataFrame, candidates: pd.DataFrame, k: int = TOP_K):
+        read = set(shelf["Title"].astype(str).str.casefold())
+        candidates = candidates[~candidates["Title"].astype(str).str.casefold().isin(read)]
+        self.candidates = candidates[CANDIDATE_COLUMNS].reset_index(drop=True)
+        self.k = k
+
+        shelf_parts, candidate_parts = _feature_parts(shelf), _feature_parts(self.candidates)
+        vocabulary = pd.Index(sorted(set().union(*(names for _, _, names, _ in shelf_parts + candidate_parts))))
+        self._matrix = _features(candidate_parts, len(self.candidates), vocabulary)
+        self._shelf = _features(shelf_parts, len(shelf), vocabulary)
+        self._titles = shelf["Title"].astype(str).to_numpy()
+        # only books rated above 3 pull the profile, a 5 twice as hard as a 4
+        self._weights = np.clip(shelf["Rating"].to_numpy(dtype=float) - 3, 0, None)
+
+        # top-k answers are cached per shelf book and per profile
+        self.neighbours = lru_cache(maxsize=1024)(self._neighbours)
+        self.recommend = lru_cache(maxsize=64)(self._recommend)
+
+    def __len__(self):
+        return len(self.candidates)
+
+    # candidates closest to one shelf book
+    def similar(self, book_id: int, k: int = None) -> pd.DataFrame:
+        top, scores = self.neighbours(book_id)
+        k = min(k or self.k, self.k)
+        return self.candidates.iloc[top[:k]].assign(Score=scores[:k].round(3))
+
+    def _neighbours(self, book_id: int) -> tuple:
+        scores = self._scores(self._shelf[book_id])
+        top = _top_indices(scores, self.k)
+        return top, scores[top]
+
+    # candidates closest to the rating-weighted profile of the given shelf books (the whole shelf when None)
+    def _recommend(self, book_ids: tuple = None, k: int = None) -> pd.DataFrame:
+        rows = np.asarray(book_ids, dtype=np.int64) if book_ids is not None else np.arange(self._shelf.shape[0])
+        weights = self._weights[rows]
+        if not len(self.candidates) or not weights.any():
+            return self.candidates.iloc[:0].assign(Score=[], **{"Because You Read": []})
+
+        liked = rows[weights > 0]
+        profile = sparse.csr_matrix(weights[weights > 0]) @ self._shelf[liked]
+        scores = self._scores(profile) / max(np.sqrt(profile.multiply(profile).sum()), 1e-12)
+        top = _top_indices(scores, k or self.k)
+        top = top[scores[top] > 0]
+
+        # the liked book that is closest to each pick
+        reasons = (self._shelf[liked] @ self._matrix[top].T).toarray().argmax(axis=0)
+        return self.candidates.iloc[top].assign(Score=scores[top].round(3), **{"Because You Read": self._titles[liked[reasons]]})
+
+    # dot product of one sparse row with every candidate
+    def _scores(self, row: sparse.csr_matrix) -> np.ndarray:
+        return self._matrix @ row.toarray().ravel()
+
+
+# (rows, codes, names, weight per entry) for every feature kind, names are per-frame categories
+def _feature_parts(df: pd.DataFrame) -> list:
+    positions = np.arange(len(df))
+    parts = []
+
+    # "Kang Myeong-seok, BTS" counts for both authors, the author weight is shared between them
+    authors = pd.Categorical(df["Author"].astype(str))
+    splits = [AUTHOR_SEPARATOR.split(author) for author in authors.categories]
+    author_names = [f"Author={name}" for split in splits for name in split]
+    counts = np.array([len(split) for split in splits] + [0])
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    per_row = counts[authors.codes]
+    rows = np.repeat(positions, per_row)
+    codes = np.repeat(offsets[authors.codes], per_row) + np.arange(per_row.sum()) - np.repeat(np.cumsum(per_row) - per_row, per_row)
+    parts.append((rows, codes, author_names, FEATURE_WEIGHTS["Author"] / np.repeat(per_row, per_row)))
+
+    for column in ("Genre", "Language"):
+        values = pd.Categorical(df[column].astype(str))
+        parts.append((positions, values.codes, [f"{column}={value}" for value in values.categories], np.full(len(df), FEATURE_WEIGHTS[column])))
+
+    lengths = pd.cut(df["Pages"].to_numpy(dtype=float), PAGE_BINS, labels=PAGE_LABELS)
+    parts.append((positions, lengths.codes, [f"Length={label}" for label in PAGE_LABELS], np.full(len(df), FEATURE_WEIGHTS["Length"])))
+    return parts
+
+
+# L2-normalised sparse rows, one per book
+def _features(parts: list, size: int, vocabulary: pd.Index) -> sparse.csr_matrix:
+    rows, columns, values = [], [], []
+    for part_rows, codes, names, weights in parts:
+        known = codes >= 0
+        rows.append(part_rows[known])
+        columns.append(vocabulary.get_indexer(names)[codes[known]])
+        values.append(weights[known])
+
+    matrix = sparse.csr_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))), shape=(size, len(vocabulary)), dtype=np.float32)
+    norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A.ravel()
+    return sparse.diags(1 / np.maximum(norms, 1e-12)).astype(np.float32) @ matrix
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
@@ -0,0 +1,133 @@
+import io
+import os
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from filters import FilterEngine, FilterState
+from loader import CACHED_VERSIONS, SHELF_DIR, load_month, load_partition, load_partitions, partition_key, partition_months, prepare_books, shelf_partitions
+from schema import CATEGORICAL_COLUMNS
+from storage import write_atomic
+
+YEAR_ROLLUP_PATH = ".cache/rollups/years.csv"
+YEAR_ROLLUP_COLUMNS = ["Year", "Version", "Books", "Pages", "Rating Sum"]
+
+ROLLUP_KEYS = ["Month", "Genre", "Language", "Author"]
+# half-star rating buckets of the histogram columns
+RATING_BUCKETS = np.arange(1, 11) / 2
+RATING_COLUMNS = [f"Rating {bucket}" for bucket in RATING_BUCKETS]
+
+
+# one small row per reading year
+def year_rollup(year: int, df: pd.DataFrame, version: tuple) -> dict:
+    return {
+        "Year": year,
+        "Version": "-".join(map(str, version)),
+        "Books": len(df),
+        "Pages": int(df["Pages"].sum()),
+        "Rating Sum": float(df["Rating"].sum()),
+    }
+
+
+# yearly totals for every partition, only partitions whose file or logs changed are re-read
+def load_year_rollups(shelf_dir: str = SHELF_DIR) -> pd.DataFrame:
+    return _year_rollups(partition_key(shelf_partitions(shelf_dir), shelf_dir))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _year_rollups(key: tuple) -> pd.DataFrame:
+    stored = {}
+    if os.path.exists(YEAR_ROLLUP_PATH):
+        stored = {row["Year"]: row for row in pd.read_csv(YEAR_ROLLUP_PATH).to_dict(orient="records")}
+
+    rows = []
+    changed = len(stored) != len(key)
+    for year, path, version in key:
+        row = stored.get(year)
+        if row is None or row["Version"] != "-".join(map(str, version)):
+            row = year_rollup(year, load_partition(year, path, version), version)
+            changed = True
+        rows.append(row)
+
+    rollups = pd.DataFrame(rows, columns=YEAR_ROLLUP_COLUMNS)
+    if changed:
+        buffer = io.StringIO()
+        rollups.to_csv(buffer, index=False)
+        write_atomic(YEAR_ROLLUP_PATH, buffer.getvalue().encode())
+
+    return rollups.assign(**{"Average Rating": (rollups["Rating Sum"] / rollups["Books"]).round(2)})
+
+
+# one rollup cell per book: key columns, counts, sums and a one-hot rating bucket
+def _book_cells(df: pd.DataFrame) -> pd.DataFrame:
+    buckets = (df["Rating"].to_numpy(dtype=float) * 2).round().clip(1, 10).astype(int) - 1
+    histogram = pd.DataFrame(np.eye(len(RATING_BUCKETS), dtype=np.int32)[buckets], columns=RATING_COLUMNS, index=df.index)
+    cells = df[ROLLUP_KEYS].assign(Books=1, Pages=df["Pages"].astype(np.int64), **{"Rating Sum": df["Rating"].astype(float)})
+    return pd.concat([cells, histogram], axis=1)
+
+
+# counts, sums and rating histograms per (month, genre, language, author)
+def rollup_cells(df: pd.DataFrame) -> pd.DataFrame:
+    return _book_cells(df).groupby(ROLLUP_KEYS, observed=True, sort=False).sum().reset_index()
+
+
+# rollup cells of every loaded month, answered without touching book rows
+class RollupCube:
+    def __init__(self, table: pd.DataFrame):
+        self.table = table
+        self._engine = FilterEngine(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    # answers the sidebar selection from the matching cells only
+    def summarize(self, state: FilterState) -> dict:
+        return _summary(state.replay(self._engine).view())
+
+
+# cells of one month, keyed like load_month so a logged book only regroups its own month
+@st.cache_data(show_spinner=False, max_entries=12 * CACHED_VERSIONS)
+def _month_cells(year: int, month: str, path: str, snapshot_version: Optional[tuple], log_version: Optional[tuple]) -> pd.DataFrame:
+    return rollup_cells(prepare_books(load_month(year, month, path, snapshot_version, log_version)))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CACHED_VERSIONS)
+def _load_rollup_cube(key: tuple) -> RollupCube:
+    tables = []
+    for year, path, version in key:
+        snapshot_version, logs = version
+        logged = dict(logs)
+        tables += [_month_cells(year, month, path, snapshot_version, logged.get(month)) for month in partition_months(year, path, version)]
+    if not tables:
+        return RollupCube(rollup_cells(load_partitions(key)))
+
+    table = pd.concat(tables, ignore_index=True)
+    # months disagree on categories, first-appearance order again so ties resolve like the book rows
+    for column in ROLLUP_KEYS:
+        if column in CATEGORICAL_COLUMNS:
+            table[column] = pd.Categorical(table[column], categories=table[column].dropna().unique())
+    return RollupCube(table)
+
+
+def load_rollup_cube(years: Optional[Iterable[int]] = None) -> RollupCube:
+    return _load_rollup_cube(partition_key(years))
+
+
+# same figures straight from book rows, used when the page cap cuts through cells
+def summarize_rows(df: pd.DataFrame) -> dict:
+    return _summary(_book_cells(df))
+
+
+def _summary(cells: pd.DataFrame) -> dict:
+    total = int(cells["Books"].sum())
+    genre_counts = cells.groupby("Genre", observed=True)["Books"].sum()
+    language_counts = cells.groupby("Language", observed=True)["Books"].sum()
+    return {
+        "Books": total,
+        "Average Rating": round(float(cells["Rating Sum"].sum()) / total, 2) if total else float("nan"),
+        "Genre Counts": genre_counts[genre_counts > 0],
+        "Language Counts": language_counts[language_counts > 0],
+        "Rating Histogram": pd.Series(cells[RATING_COLUMNS].sum().to_numpy(), index=RATING_BUCKETS),
+    }
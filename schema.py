@@ -0,0 +1,51 @@
+import calendar
+
+import pandas as pd
+
+MONTHS = list(calendar.month_name)[1:]
+DATE_FORMAT = "%m-%d-%Y"
+
+# dtypes every shelf frame is coerced to at load time
+SCHEMA = {
+    "Year": "int16",
+    "Month": pd.CategoricalDtype(MONTHS, ordered=True),
+    "Title": "string",
+    "Series": "string",
+    "Author": "category",
+    "Genre": "category",
+    "Language": "category",
+    "Start Date": "datetime64[ns]",
+    "End Date": "datetime64[ns]",
+    "Rating": "float32",
+    "Pages": "int16",
+    "Cover": "string",
+    "Cover Width": "int16",
+    "Summary": "string",
+    "Thoughts": "string",
+    "Book ID": "string",
+}
+
+# by name only, a CategoricalDtype compares equal to "category" and would lose its fixed categories
+DATE_COLUMNS = [column for column, dtype in SCHEMA.items() if isinstance(dtype, str) and dtype == "datetime64[ns]"]
+CATEGORICAL_COLUMNS = [column for column, dtype in SCHEMA.items() if isinstance(dtype, str) and dtype == "category"]
+
+
+# coerces a raw shelf to SCHEMA, columns the schema doesn't know are left alone
+def enforce_schema(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    for column, dtype in SCHEMA.items():
+        if column not in df:
+            continue
+
+        if column in DATE_COLUMNS:
+            if not pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = pd.to_datetime(df[column], format=DATE_FORMAT)
+            df[column] = df[column].astype(dtype)
+        elif column in CATEGORICAL_COLUMNS:
+            # categories keep first-appearance order so ties resolve like plain strings
+            df[column] = pd.Categorical(df[column], categories=df[column].dropna().unique())
+        else:
+            df[column] = df[column].astype(dtype)
+
+    return df
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+SEARCH_INDEX_PATH = ".cache/search/index.db"
+SEARCH_COLUMNS = ["Title", "Author", "Summary", "Thoughts"]
+# bm25 weight per column, title and author hits rank above words in the reviews
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0, 1.0)
+SEARCH_LIMIT = 50
+
+SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews USING fts5(title, author, summary, thoughts, tokenize='porter unicode61 remove_diacritics 2');
+CREATE TABLE IF NOT EXISTS documents (key TEXT PRIMARY KEY, digest TEXT NOT NULL, docid INTEGER NOT NULL);
+"""
+
+
+# full-text index over titles, authors and reviews, kept in SQLite FTS5 on disk
+class SearchIndex:
+    def __init__(self, df: pd.DataFrame, path: str = SEARCH_INDEX_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA_SQL)
+        self._lock = threading.Lock()
+        self.reindexed = self.sync(df)
+
+    # re-indexes only books whose text changed, returns how many were written
+    def sync(self, df: pd.DataFrame) -> int:
+        keys = document_keys(df)
+        texts = list(zip(*(df[column].astype(object).where(df[column].notna(), "").tolist() for column in SEARCH_COLUMNS)))
+        digests = [hashlib.sha1("\x1f".join(row).encode()).hexdigest() for row in texts]
+        years = sorted({key.split(":", 1)[0] for key in keys})
+
+        with self._lock, self._connection:
+            stored = {}
+            for year in years:
+                stored.update((key, (digest, docid)) for key, digest, docid in self._connection.execute("SELECT key, digest, docid FROM documents WHERE key LIKE ?", (f"{year}:%",)))
+
+            next_docid = (self._connection.execute("SELECT MAX(docid) FROM documents").fetchone()[0] or 0) + 1
+            changed = 0
+            docids = []
+            for key, digest, row in zip(keys, digests, texts):
+                digest_before, docid = stored.pop(key, (None, None))
+                if digest_before == digest:
+                    docids.append(docid)
+                    continue
+                if docid is None:
+                    docid, next_docid = next_docid, next_docid + 1
+                else:
+                    self._connection.execute("DELETE FROM reviews WHERE rowid = ?", (docid,))
+                self._connection.execute("INSERT INTO reviews (rowid, title, author, summary, thoughts) VALUES (?, ?, ?, ?, ?)", (docid, *row))
+                self._connection.execute("INSERT OR REPLACE INTO documents (key, digest, docid) VALUES (?, ?, ?)", (key, digest, docid))
+                docids.append(docid)
+                changed += 1
+
+            # books removed from the synced years
+            for key, (_, docid) in stored.items():
+                self._connection.execute("DELETE FROM reviews WHERE rowid = ?", (docid,))
+                self._connection.execute("DELETE FROM documents WHERE key = ?", (key,))
+                changed += 1
+
+        # docid of every row position, maps matches back onto the frame
+        self._docids = pd.Index(docids)
+        return changed
+
+    # row labels of the best matches, optionally restricted to the given labels
+    def search(self, query: str, labels=None, limit: int = SEARCH_LIMIT) -> list:
+        match = match_expression(query)
+        if not match:
+            return []
+
+        with self._lock:
+            docids = [docid for docid, in self._connection.execute(f"SELECT rowid FROM reviews WHERE reviews MATCH ? ORDER BY bm25(reviews, {', '.join(map(str, SEARCH_WEIGHTS))})", (match,))]
+
+        positions = self._docids.get_indexer(docids)
+        positions = positions[positions >= 0]
+        if labels is not None:
+            positions = positions[np.isin(positions, np.asarray(labels))]
+        return positions[:limit].tolist()
+
+
+# stable per-book key, the year plus the title (numbered when a title repeats within a year)
+def document_keys(df: pd.DataFrame) -> list:
+    years = df["Year"].astype(str) if "Year" in df else pd.Series("0", index=df.index)
+    titles = df["Title"].astype(object)
+    repeats = titles.groupby([years, titles]).cumcount()
+    return [f"{year}:{title}" if not repeat else f"{year}:{title}#{repeat}" for year, title, repeat in zip(years.tolist(), titles.tolist(), repeats.tolist())]
+
+
+# every word of the query must match, quoted so FTS5 operators in user input are read as words
+def match_expression(query: str) -> str:
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# "Jujutsu Kaisen #10" -> ("Jujutsu Kaisen", 10)
+VOLUME_PATTERN = r"^(?P<Series>.+?)\s*#(?P<Volume>\d+)$"
+# unnumbered books by one author that open with the same words, e.g. "A Court of ..."
+PREFIX_WORDS = 3
+
+
+# series name and volume number of every book, resolved once per load
+class SeriesIndex:
+    def __init__(self, df: pd.DataFrame):
+        resolved = resolve_series(df)
+        self.series = resolved["Series"]
+        self.volume = resolved["Volume"]
+        self.table = series_table(df, resolved)
+
+    def __len__(self):
+        return len(self.table)
+
+    # one book-shaped row per series in df, so the chart builders and cards read it like a book
+    def group(self, df: pd.DataFrame) -> pd.DataFrame:
+        series = self.series.loc[df.index]
+        groups = df.assign(Series=series, Label=df.index).groupby(series.to_numpy(), sort=False)
+        first = groups.first()
+        books = groups.size()
+
+        grouped = first.assign(**{
+            "Title": np.where(books > 1, first["Series"] + " (" + books.astype(str) + " books)", first["Title"].astype(str)),
+            "Start Date": groups["Start Date"].min(),
+            "End Date": groups["End Date"].max(),
+            "Rating": groups["Rating"].mean().astype("float32"),
+            "Pages": groups["Pages"].sum(),
+            "Books": books,
+        })
+        # labelled by the series' first book, so its cover stands for the series
+        return grouped.set_index("Label").rename_axis(None)
+
+
+# Series and Volume per book: explicit Series column, then "#n" titles, then shared openings
+def resolve_series(df: pd.DataFrame) -> pd.DataFrame:
+    titles = df["Title"].astype(str)
+    authors = df["Author"].astype(str)
+    numbered = titles.str.extract(VOLUME_PATTERN)
+
+    series = df["Series"].astype("string") if "Series" in df else pd.Series(pd.NA, index=df.index, dtype="string")
+    series = series.fillna(numbered["Series"].astype("string"))
+    volume = pd.to_numeric(numbered["Volume"]).astype("Int64").where(series.notna() & numbered["Series"].notna())
+
+    words = titles.str.split()
+    openings = words.str[:PREFIX_WORDS].str.join(" ")
+    shared = series.isna() & (words.str.len() > PREFIX_WORDS)
+    shared &= df.assign(Opening=openings, Writer=authors)[shared].groupby(["Writer", "Opening"])["Title"].transform("size").reindex(df.index).fillna(0).gt(1)
+    series = series.mask(shared, openings + " …")
+
+    # books without a number are counted in reading order within their series
+    order = df.assign(Series=series)[series.notna()].sort_values("Start Date", kind="stable").groupby("Series").cumcount() + 1
+    volume = volume.fillna(order.reindex(df.index).astype("Int64"))
+
+    # everything else, standalones by the same author included, is a series of one named after itself
+    return pd.DataFrame({"Series": series.fillna(titles), "Volume": volume.where(series.notna())}, index=df.index)
+
+
+# totals per series: books, volume range, pages, average rating and the reading span
+def series_table(df: pd.DataFrame, resolved: pd.DataFrame) -> pd.DataFrame:
+    groups = df.assign(Series=resolved["Series"], Volume=resolved["Volume"]).groupby("Series", sort=False)
+    table = pd.DataFrame({
+        "Author": groups["Author"].first().astype(str),
+        "Books": groups.size(),
+        "First Volume": groups["Volume"].min(),
+        "Last Volume": groups["Volume"].max(),
+        "Pages": groups["Pages"].sum().astype("int64"),
+        "Average Rating": groups["Rating"].mean().astype(float).round(2),
+        "Start Date": groups["Start Date"].min(),
+        "End Date": groups["End Date"].max(),
+    })
+    table["Span Days"] = (table["End Date"] - table["Start Date"]).dt.days + 1
+    return table.reset_index()
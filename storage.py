@@ -0,0 +1,21 @@
+import os
+import tempfile
+
+# mkstemp creates 0600 files, written files get the usual umask permissions instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# writes through a temp file and a rename, so readers never see a half-written file
+def write_atomic(path: str, data: bytes):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
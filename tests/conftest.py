@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+
+# a throwaway working directory with a copy of the shipped 2024 shelf, so logs and compaction never touch the repo
+@pytest.fixture
+def shelf(tmp_path, monkeypatch):
+    os.makedirs(tmp_path / "data" / "shelf")
+    with open(os.path.join(ROOT, "data", "shelf", "2024.csv"), "rb") as source:
+        (tmp_path / "data" / "shelf" / "2024.csv").write_bytes(source.read())
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BOOKSHELF_DISK_CACHE", "off")
+    return tmp_path
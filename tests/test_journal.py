@@ -0,0 +1,100 @@
+import os
+
+import pandas as pd
+
+import journal
+from loader import compact_partition, load_books, load_progress, read_source
+from progress import ReadingProgress
+from schema import DATE_FORMAT
+
+
+# a shelf row as the entry form would log it
+def entry(df: pd.DataFrame, title: str, **changes) -> dict:
+    row = df[df["Title"] == title].iloc[0]
+    book = {field: row[field] for field in journal.BOOK_FIELDS if field not in ("Month", "Book ID")}
+    book.update({field: row[field].strftime(DATE_FORMAT) for field in ("Start Date", "End Date")})
+    return {**{field: None if pd.isnull(value) else value for field, value in book.items()}, **changes}
+
+
+def test_reread_is_a_second_book(shelf):
+    df = load_books()
+    journal.append(entry(df, "Naruto #1", Author="Someone Else"), (2024, "February"))
+
+    after = load_books()
+    assert len(after) == len(df) + 1
+    assert sorted(after.loc[after["Title"] == "Naruto #1", "Author"].astype(str)) == ["Masashi Kishimoto", "Someone Else"]
+
+
+def test_rename_keeps_the_book_with_that_title(shelf):
+    df = load_books()
+    villain = df[df["Title"] == "Starter Villain"].iloc[0]
+    journal.append(entry(df, "Starter Villain", Title="Throne in the Dark", Replaces=villain["Book ID"]), (2024, "March"))
+
+    after = load_books()
+    assert len(after) == len(df)
+    assert (after["Title"] == "Throne in the Dark").sum() == 2
+    assert not (after["Title"] == "Starter Villain").any()
+
+
+def test_edit_keeps_series(shelf):
+    df = load_books()
+    throne = df[df["Title"] == "Throne in the Dark"].iloc[0]
+    edit = entry(df, "Throne in the Dark", Rating=2.0, Replaces=throne["Book ID"])
+    del edit["Series"]
+    journal.append(edit, (2024, "March"))
+
+    after = load_books().set_index("Book ID")
+    assert after.at[throne["Book ID"], "Rating"] == 2.0
+    assert after.at[throne["Book ID"], "Series"] == "Throne in the Dark"
+
+
+def test_replay_is_idempotent(shelf):
+    df = load_books()
+    month = df[df["Month"] == "March"].drop(columns="Year")
+    villain = month[month["Title"] == "Starter Villain"].iloc[0]
+    journal.append(entry(df, "Starter Villain", Rating=3.0, Replaces=villain["Book ID"]), (2024, "March"))
+    journal.append(entry(df, "Starter Villain", Title="Starter Villain II"), (2024, "March"))
+
+    entries = journal.read_log(2024, "March")
+    once = journal.replay(month, entries)
+    assert len(once) == len(month) + 1
+    pd.testing.assert_frame_equal(journal.replay(once, entries), once)
+
+
+def test_torn_last_line_is_skipped(shelf):
+    df = load_books()
+    journal.append(entry(df, "Starter Villain", Title="Starter Villain II"), (2024, "March"))
+    with open(journal.log_path(2024, "March"), "a", encoding="utf-8") as file:
+        file.write('{"Title": "Half')
+
+    assert [book["Title"] for book in journal.read_log(2024, "March")] == ["Starter Villain II"]
+
+
+def test_compaction_keeps_format_and_rows(shelf):
+    df = load_books()
+    villain = df[df["Title"] == "Starter Villain"].iloc[0]
+    journal.append(entry(df, "Starter Villain", Rating=3.0, Replaces=villain["Book ID"]), (2024, "March"))
+    journal.append(entry(df, "Starter Villain", Title="Late Read", **{"Start Date": "08-01-2024", "End Date": "08-03-2024"}))
+    before = load_books()
+
+    assert compact_partition(2024) == os.path.join("data", "shelf", "2024.csv")
+    assert sorted(os.listdir("data/shelf")) == ["2024.csv"]
+    assert journal.logged_months() == {}
+    assert "Book ID" in read_source("data/shelf/2024.csv")
+    pd.testing.assert_frame_equal(load_books(), before)
+
+
+def test_progress_follows_appends_and_edits(shelf):
+    df = load_books()
+    villain = df[df["Title"] == "Starter Villain"].iloc[0]
+    logged = [
+        (entry(df, "Wayward Son", Title="Late Read", **{"Start Date": "08-01-2024", "End Date": "08-03-2024"}), None),
+        (entry(df, "Wayward Son", Title="Later Read", **{"Start Date": "08-04-2024", "End Date": "08-05-2024"}), None),
+        (entry(df, "Naruto #1", Title="Early Read"), (2024, "February")),
+        (entry(df, "Starter Villain", Pages=10, Replaces=villain["Book ID"]), (2024, "March")),
+    ]
+
+    load_progress()
+    for book, period in logged:
+        journal.append(book, period)
+        pd.testing.assert_frame_equal(load_progress().series(), ReadingProgress(load_books()).series())
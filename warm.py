@@ -0,0 +1,52 @@
+# fills the disk cache before the first visitor arrives, e.g. as a deploy step
+#
+#   python warm.py
+#   python warm.py --years 2024
+import argparse
+import logging
+import time
+
+from author_cloud import author_cloud
+from caches import cache_stats
+from charts import build_figures
+from covers import cover_thumbnail
+from loader import load_catalog, load_filter_engine, load_progress, shelf_years
+from notes import month_note
+from pace import ReadingPace
+from rollups import load_rollup_cube
+
+
+# every view of one year built like display_charts and display_cards do, so figures, word clouds and covers land in the caches under the app's keys
+def warm_year(year: int):
+    catalog, engine, progress = load_catalog([year]), load_filter_engine([year]), load_progress([year])
+    for view in ["Entire Year"] + engine.start().options("Month"):
+        if month_note(year, engine, view) is not None:
+            continue
+        start = time.perf_counter()
+        state = engine.start(None if view == "Entire Year" else view)
+        df = state.view()
+        pace = ReadingPace(df) if view == "Entire Year" else None
+        build_figures(view, df, progress, load_rollup_cube([year]).summarize(state), pace)
+        if view == "Entire Year":
+            author_cloud(df["Author"])
+        else:
+            for book_id in df.index:
+                book = catalog.by_id(book_id)
+                cover_thumbnail(book["Cover"], book["Cover Width"])
+        print(f"{year} {view:>12}  {time.perf_counter() - start:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", nargs="+", type=int, help="years to warm, every year on the shelf by default")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    for year in args.years or shelf_years():
+        warm_year(year)
+
+    print(cache_stats().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
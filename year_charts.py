@@ -0,0 +1,66 @@
+import pandas as pd
+import plotly.express as px
+
+from charts import COLORS, language_counts
+from pace import ReadingPace
+from progress import ReadingProgress
+
+
+# language dist
+def language_chart(df: pd.DataFrame, summary: dict = None):
+    if summary is None:
+        counts = language_counts(df)
+    else:
+        counts = pd.DataFrame({"Language": summary["Language Counts"].index.astype(str), "# of Books": summary["Language Counts"].to_numpy()})
+
+    fig = px.bar(counts, x="Language", y="# of Books", color="Language", color_discrete_sequence=COLORS)
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
+
+# page count vs. rating
+def rating_scatter(df: pd.DataFrame):
+    fig = px.scatter(df, x='Pages', y='Rating', color='Title', hover_data=['Title', 'Author'], color_discrete_sequence=COLORS)
+    fig.update_yaxes(range=[.5, 5.5])
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+    return fig
+
+# reading progress
+def progress_chart(df: pd.DataFrame, progress: ReadingProgress = None):
+    if progress is None:
+        progress = ReadingProgress(df)
+    series = progress.series(df.index)
+
+    fig = px.line(series, x='End Date', y='Cumulative Pages',
+                labels={'Cumulative Pages': 'Total Pages Read', 'End Date': 'Date'}, color_discrete_sequence=COLORS)
+
+    fig.update_layout(width=350, height=400)
+    fig.update_layout(showlegend=False)
+
+    fig.update_layout(
+        xaxis_title='Date',
+        yaxis_title='Total Pages Read',
+        hovermode='x unified'
+    )
+    return fig
+
+# pages read per day, with the 7-day average on top
+def pace_chart(df: pd.DataFrame, pace: ReadingPace = None):
+    if pace is None:
+        pace = ReadingPace(df)
+    daily = pace.daily.join(pace.rolling((7,))).reset_index()
+
+    fig = px.bar(daily, x="Date", y="Pages", labels={"Pages": "Pages Read"}, color_discrete_sequence=COLORS)
+    fig.add_scatter(x=daily["Date"], y=daily["7-Day Average"], mode="lines", name="7-Day Average", line_color=COLORS[4])
+    fig.update_layout(width=700, height=400)
+    fig.update_layout(showlegend=False, hovermode='x unified')
+    return fig
+
+# books per reading year, from the yearly rollups
+def year_over_year_chart(rollups: pd.DataFrame):
+    fig = px.bar(rollups.astype({"Year": str}), x="Year", y="Books", hover_data=["Pages", "Average Rating"],
+                 labels={"Books": "Books Read"}, color_discrete_sequence=COLORS)
+    fig.update_layout(width=700, height=400)
+    fig.update_layout(showlegend=False)
+    return fig